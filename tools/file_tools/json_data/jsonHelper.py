@@ -25,13 +25,86 @@ for the argparse libraries
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #==========================================================================
 
+import os
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None   # Use the standard library json module
+
 class JsonHelper(object):
     """!
     Json file processing generic helper functions
     """
+    __slots__ = ()  # No instance data, lets derived classes use __slots__
+
+    _yesAnswers = frozenset(('Y', 'YES'))   # Upper case user confirmation answers
+
     def __init__(self):
         pass
 
+    @staticmethod
+    def readJsonFile(fileName:str)->dict:
+        """!
+        @brief Read and parse a JSON data file, uses orjson if it is installed
+        @param fileName {string} Name of the JSON file to read
+        @return dictionary - Parsed JSON file data
+        @exception FileNotFoundError if the file does not exist
+        """
+        with open(fileName, 'rb') as jsonFile:
+            rawData = jsonFile.read()
+
+        if orjson is not None:
+            return orjson.loads(rawData)
+        else:
+            return json.loads(rawData)
+
+    @staticmethod
+    def writeJsonFile(fileName:str, jsonData:dict, prettyPrint:bool = True):
+        """!
+        @brief Write the JSON data file, uses orjson if it is installed.  The data
+               is written to a temporary file that then replaces fileName so an
+               interrupted write never leaves a truncated file behind.
+               Both paths write non-ASCII text as UTF-8, so the string, integer,
+               list and dictionary data used by these tools is written with the
+               same bytes with or without orjson.  Floating point values may be
+               formatted differently.
+        @param fileName {string|Path} Name of the JSON file to write
+        @param jsonData {dictionary} Data to write
+        @param prettyPrint {boolean} True = indented human readable output,
+                                     False = compact output for machine only use
+        """
+        if orjson is not None:
+            dumpOption = orjson.OPT_INDENT_2 if prettyPrint else None
+            rawData = orjson.dumps(jsonData, option=dumpOption)
+        elif prettyPrint:
+            rawData = json.dumps(jsonData, indent=2, ensure_ascii=False).encode('utf-8')
+        else:
+            rawData = json.dumps(jsonData, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        tempFileName = str(fileName)+".tmp"
+        try:
+            with open(tempFileName, 'wb') as jsonFile:
+                jsonFile.write(rawData)
+            os.replace(tempFileName, fileName)
+        except BaseException:
+            # Don't leave a partial temporary file next to the data file
+            try:
+                os.remove(tempFileName)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _inputConfirm(promptText:str)->bool:
+        """!
+        @brief Ask the user a yes/no question
+        @param promptText {string} Question prompt text
+        @return boolean - True if the user answered yes, else False
+        """
+        return input(promptText).upper() in JsonHelper._yesAnswers
+
     def _getCommitOverWriteFlag(self, entryName:str, override:bool = False):
         """!
         @brief Determine if the user is ready to commit the new entry over the existing one
@@ -43,9 +116,7 @@ class JsonHelper(object):
             commitFlag = True
         else:
             # Determine if we should overwrite existing
-            commit = input("Overwrite existing "+entryName+" entry? [Y/N]").upper()
-            if ((commit == 'Y') or (commit == "YES")):
-                commitFlag = True
+            commitFlag = self._inputConfirm("Overwrite existing "+entryName+" entry? [Y/N]")
         return commitFlag
 
     def _getCommitNewFlag(self, entryName:str):
@@ -53,11 +124,7 @@ class JsonHelper(object):
         @brief Determine if the user is ready to commit the new entry
         @param entryName {string} Name of the method that will be added
         """
-        commit = input("Add new "+entryName+" entry? [Y/N]").upper()
-        if ((commit == 'Y') or (commit == "YES")):
-            return True
-        else:
-            return False
+        return self._inputConfirm("Add new "+entryName+" entry? [Y/N]")
 
     def _getCommitFlag(self, entryName:str, entryKeys:list, override:bool = False):
         """!
@@ -70,3 +137,17 @@ class JsonHelper(object):
             return self._getCommitOverWriteFlag(entryName, override)
         else:
             return self._getCommitNewFlag(entryName)
+
+    def _commitEntry(self, entryTable:dict, entryName:str, newEntry:dict, override:bool = False)->bool:
+        """!
+        @brief Add or overwrite the entryTable entry if the user is ready to commit it
+        @param entryTable {dictionary} Entry name -> entry data table to update
+        @param entryName {string} Name of the entry that will be added
+        @param newEntry {dictionary} Entry data to add
+        @param override {boolean} True = force overwrite, False = ask user
+        @return boolean - True if the entry was written, else False
+        """
+        commitFlag = self._getCommitFlag(entryName, entryTable, override)
+        if commitFlag:
+            entryTable[entryName] = newEntry
+        return commitFlag
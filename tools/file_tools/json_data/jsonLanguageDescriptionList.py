@@ -26,13 +26,40 @@ for the argparse libraries
 #==========================================================================
 
 import re
-import json
 from .jsonHelper import JsonHelper
 
 class LanguageDescriptionList(JsonHelper):
     """!
     Language description list data
     """
+    __slots__ = ('filename', 'langJsonData', 'langDataDirty')
+
+    # User input validity checks
+    _langNameRegx = re.compile('^[a-z].*')
+    _langCodeRegx = re.compile(r'^[a-z]{2}\Z')
+    _regionCodeRegx = re.compile(r'^[A-Z]{2}\Z')
+
+    # Language entry property names, in _createLanguageEntry() order
+    _languagePropertyList = ('LANG', 'LANG_regions', 'LANGID', 'LANGID_regions', 'isoCode', 'compileSwitch')
+
+    # Language property -> (data type, description, is list)
+    _propertyReturnData = {'LANG': ("string", "Linux environment language code", False),
+                           'LANG_regions': ("string", "Linux environment region codes for this language code", True),
+                           'LANGID': ("LANGID", "Windows LANGID & 0xFF language code(s)", True),
+                           'LANGID_regions': ("LANGID", "Windows full LANGID language code(s)", True),
+                           'isoCode': ("string", "ISO 639 set 1 language code", False)}
+    _unknownPropertyReturnData = (None, None, False)
+
+    # Language properties stored as text
+    _textPropertySet = frozenset(('LANG', 'LANG_regions', 'isoCode'))
+
+    # Language property -> CPP property method name
+    _propertyMethodNames = {'LANG': "getLANGLanguage",
+                            'LANG_regions': "getLANGRegionList",
+                            'LANGID': "getLANGIDCode",
+                            'LANGID_regions': "getLANGIDList",
+                            'isoCode': "getLangIsoCode"}
+
     def __init__(self, langListFileName = None):
         """!
         @brief LanguageDescriptionList constructor
@@ -46,35 +73,40 @@ class LanguageDescriptionList(JsonHelper):
             self.filename = langListFileName
 
         try:
-            langJsonFile = open(self.filename, 'r', encoding='utf-8')
+            self.langJsonData = self.readJsonFile(self.filename)
+            self.langDataDirty = False
         except FileNotFoundError:
             self.langJsonData = {'default':{'name':"english", 'isoCode':"en"}, 'languages':{}}
-        else:
-            self.langJsonData = json.load(langJsonFile)
-            langJsonFile.close()
+            self.langDataDirty = True   # File does not exist yet, update() must create it
 
     def _printError(self, errorStr:str):
         print ("Error: "+errorStr)
 
-    def update(self):
+    def update(self, prettyPrint:bool = True):
         """!
-        @brief Update the JSON file with the current contents of self.langJsonData
+        @brief Update the JSON file with the current contents of self.langJsonData,
+               if the data has changed since it was last read or written
+        @param prettyPrint {boolean} True = indented output, False = compact output
         """
-        with open(self.filename, 'w', encoding='utf-8') as langJsonFile:
-            json.dump(self.langJsonData, langJsonFile, indent=2)
+        if self.langDataDirty:
+            self.writeJsonFile(self.filename, self.langJsonData, prettyPrint)
+            self.langDataDirty = False
 
     def setDefault(self, langName:str):
         """!
         @brief Set the default language
         @param langName (string) - Language name to use default if detection fails
         """
-        if langName.lower() in self.langJsonData['languages'].keys():
-            defaultDict = {'name':langName, 'isoCode':self.langJsonData['languages'][langName]['isoCode']}
+        languages = self.langJsonData['languages']
+        langKey = langName.lower()
+        if langKey in languages:
+            defaultDict = {'name':langKey, 'isoCode':languages[langKey]['isoCode']}
             self.langJsonData['default'] = defaultDict
+            self.langDataDirty = True
         else:
             self._printError("You must select a current language as the default.")
             print("Available languages:")
-            for langName in list(self.langJsonData['languages']):
+            for langName in languages:
                 print("  "+langName)
 
     def getDefaultData(self):
@@ -87,29 +119,35 @@ class LanguageDescriptionList(JsonHelper):
         return defaultLang, defaultIsoCode
 
     @staticmethod
-    def _createLanguageEntry(linuxEnvCode:str = "", linuxRegionList:list = [],
-                             windowsLangId:list = [], windowsRegionList:list = [],
+    def _createLanguageEntry(linuxEnvCode:str = "", linuxRegionList:list|None = None,
+                             windowsLangId:list|None = None, windowsRegionList:list|None = None,
                              iso639Code:str = "", compileSwitch:str = "") ->dict:
         """!
         @brief Create a language dictionart entry
 
         @param linuxEnvCode (string) - linux LANG environment value for this language
-        @param linuxRegionList (list of strings) - Linux LANG region codes for this language
-        @param windowsLangId (list of numbers) - Windows LANGID & 0xFF value(s) for this language
-        @param windowsRegionList (list of numbers) - Windows LANGID value(s) for this language
+        @param linuxRegionList (list of strings|None) - Linux LANG region codes for this language
+        @param windowsLangId (list of numbers|None) - Windows LANGID & 0xFF value(s) for this language
+        @param windowsRegionList (list of numbers|None) - Windows LANGID value(s) for this language
         @param iso639Code (string) - ISO 639 set 3 language code
         @param compileSwitch (string) - Language compile switch
 
         @return language dictionary object
         """
-        langData = [('LANG', linuxEnvCode),
-                    ('LANG_regions', linuxRegionList),
-                    ('LANGID', windowsLangId),
-                    ('LANGID_regions', windowsRegionList),
-                    ('isoCode', iso639Code),
-                    ('compileSwitch', compileSwitch)]
-        langEntry = dict(langData)
-        return langEntry
+        # Use new empty lists, not shared default list objects
+        if linuxRegionList is None:
+            linuxRegionList = []
+        if windowsLangId is None:
+            windowsLangId = []
+        if windowsRegionList is None:
+            windowsRegionList = []
+
+        return {'LANG': linuxEnvCode,
+                'LANG_regions': linuxRegionList,
+                'LANGID': windowsLangId,
+                'LANGID_regions': windowsRegionList,
+                'isoCode': iso639Code,
+                'compileSwitch': compileSwitch}
 
     def getLanguageList(self)->list:
         """!
@@ -142,9 +180,8 @@ class LanguageDescriptionList(JsonHelper):
         @return tuple (string, list of strings) - Current ['languages'][entryName]['LANG'] data,
                                                   and ['languages'][entryName]['LANGID_regions'] data
         """
-        langCode = self.langJsonData['languages'][languageName]['LANG']
-        regionList = self.langJsonData['languages'][languageName]['LANG_regions']
-        return langCode, regionList
+        langEntry = self.langJsonData['languages'][languageName]
+        return langEntry['LANG'], langEntry['LANG_regions']
 
     def getLanguageLANGIDData(self, languageName:str)->tuple:
         """!
@@ -154,17 +191,8 @@ class LanguageDescriptionList(JsonHelper):
                 Current ['languages'][entryName]['LANGID'] data,
                 and ['languages'][entryName]['LANGID_regions'] data
         """
-        langCode = self.langJsonData['languages'][languageName]['LANGID']
-        regionList = self.langJsonData['languages'][languageName]['LANGID_regions']
-        return langCode, regionList
-
-    def getLanguageIsoCodeData(self, languageName:str)->str:
-        """!
-        @brief Get the isoCode data for the given entryName language
-        @param languageName {string} Language entry key to fetch the ptoperty value from
-        @return string - Current ['languages'][entryName][isoCode] data
-        """
-        return self.langJsonData['languages'][languageName]['isoCode']
+        langEntry = self.langJsonData['languages'][languageName]
+        return langEntry['LANGID'], langEntry['LANGID_regions']
 
     def getLanguageCompileSwitchData(self, languageName:str)->str:
         """!
@@ -175,13 +203,12 @@ class LanguageDescriptionList(JsonHelper):
         return self.langJsonData['languages'][languageName]['compileSwitch']
 
     @staticmethod
-    def getLanguagePropertyList()->list:
+    def getLanguagePropertyList()->tuple:
         """!
         @brief Return a tuple list of the usable language dictionary entries
-        @return list of language entry property names
+        @return tuple of language entry property names
         """
-        entryTemplate = LanguageDescriptionList._createLanguageEntry()
-        return list(entryTemplate.keys())
+        return LanguageDescriptionList._languagePropertyList
 
     @staticmethod
     def getLanguagePropertyReturnData(propertyName:str)->tuple:
@@ -192,18 +219,7 @@ class LanguageDescriptionList(JsonHelper):
                         Description or None if the propertyName is unknown
                         True if data is a list else False
         """
-        if propertyName == 'LANG':
-            return "string", "Linux environment language code", False
-        elif propertyName == 'LANG_regions':
-            return "string", "Linux environment region codes for this language code", True
-        elif propertyName == 'LANGID':
-            return "LANGID", "Windows LANGID & 0xFF language code(s)", True
-        elif propertyName == 'LANGID_regions':
-            return "LANGID", "Windows full LANGID language code(s)", True
-        elif propertyName == 'isoCode':
-            return "string", "ISO 639 set 1 language code", False
-        else:
-            return None, None, False
+        return LanguageDescriptionList._propertyReturnData.get(propertyName, LanguageDescriptionList._unknownPropertyReturnData)
 
     @staticmethod
     def isLanguagePropertyText(propertyName:str)->bool:
@@ -213,18 +229,7 @@ class LanguageDescriptionList(JsonHelper):
         @return boolean - True if the data is stored as text or
                           False if the data is stored as a number
         """
-        if propertyName == 'LANG':
-            return True
-        elif propertyName == 'LANG_regions':
-            return True
-        elif propertyName == 'LANGID':
-            return False
-        elif propertyName == 'LANGID_regions':
-            return False
-        elif propertyName == 'isoCode':
-            return True
-        else:
-            return False
+        return propertyName in LanguageDescriptionList._textPropertySet
 
     @staticmethod
     def getLanguagePropertyMethodName(propertyName:str)->str:
@@ -233,18 +238,7 @@ class LanguageDescriptionList(JsonHelper):
         @param propertyName (string) Name of the property from getLanguagePropertyList()
         @return string CPP description or None if the propertyName is unknown
         """
-        if propertyName == 'LANG':
-            return "getLANGLanguage"
-        elif propertyName == 'LANG_regions':
-            return "getLANGRegionList"
-        elif propertyName == 'LANGID':
-            return "getLANGIDCode"
-        elif propertyName == 'LANGID_regions':
-            return "getLANGIDList"
-        elif propertyName == 'isoCode':
-            return "getLangIsoCode"
-        else:
-            return None
+        return LanguageDescriptionList._propertyMethodNames.get(propertyName)
 
     @staticmethod
     def getLanguageIsoPropertyMethodName()->str:
@@ -272,60 +266,48 @@ class LanguageDescriptionList(JsonHelper):
                                               windowsLangId, windowsRegionList,
                                               iso639Code, compileSwitch)
         self.langJsonData['languages'][langName] = langEntry
+        self.langDataDirty = True
+
+    def _inputValidValue(self, promptText:str, validRegx, errorText:str)->str:
+        """!
+        @brief Prompt the user until the lower case input matches validRegx
+        @param promptText {string} User input prompt
+        @param validRegx {re.Pattern} Compiled validity check expression
+        @param errorText {string} Error message to print for invalid input
+        @return string - valid user input value
+        """
+        while True:
+            value = input(promptText).lower()
+            if validRegx.match(value):
+                return value
+            self._printError(errorText)
 
     def _inputLanguageName(self)->str:
         """!
         @brief Get the language from user input and check for validity
         @return string - language name
         """
-        languageName = ""
-        while(languageName == ""):
-            name = input("Enter language name value to be used for class<lang> generation: ").lower()
-
-            # Check validity
-            if re.match('^[a-z].*', name):
-                # Valid name
-                languageName = name
-            else:
-                # invalid name
-                self._printError("Only characters a-z are allowed in the <lang> name, try again.")
-        return languageName
+        return self._inputValidValue("Enter language name value to be used for class<lang> generation: ",
+                                     LanguageDescriptionList._langNameRegx,
+                                     "Only characters a-z are allowed in the <lang> name, try again.")
 
     def _inputIsoTranslateCode(self)->str:
         """!
         @brief Get the ISO 639-1 translate language code from user input and check for validity
         @return string - translate code
         """
-        isoTranslateId = ""
-        while(isoTranslateId == ""):
-            transId = input("Enter ISO 639-1 translate language code (2 lower case characters): ").lower()
-
-            # Check validity
-            if re.match('^[a-z]{2}$', transId):
-                # Valid name
-                isoTranslateId = transId
-            else:
-                # invalid name
-                self._printError("Only two characters a-z are allowed in the code, try again.")
-        return isoTranslateId
+        return self._inputValidValue("Enter ISO 639-1 translate language code (2 lower case characters): ",
+                                     LanguageDescriptionList._langCodeRegx,
+                                     "Only two characters a-z are allowed in the code, try again.")
 
     def _inputLinuxLangCode(self)->str:
         """!
         @brief Get the linux language code from user input and check for validity
         @return string - linux language code
         """
-        linuxLangId = ""
-        while(linuxLangId == ""):
-            linuxEnvCode = input("Enter linux language code (first 2 chars of 'LANG' environment value): ").lower()
-
-            # Check validity
-            if re.match('^[a-z]{2}$', linuxEnvCode):
-                # Valid name
-                linuxLangId = linuxEnvCode
-            else:
-                # invalid name
-                self._printError("Only two characters a-z are allowed in the code, try again.")
-        return linuxLangId
+        return self._inputValidValue("Enter linux language code (first 2 chars of 'LANG' environment value): ",
+                                     LanguageDescriptionList._langCodeRegx,
+                                     "Only two characters a-z are allowed in the code, try again.")
 
     def _inputLinuxLangRegions(self)->list:
         """!
@@ -343,7 +325,7 @@ class LanguageDescriptionList(JsonHelper):
             if region == "":
                 # End of list
                 break
-            elif re.match('^[A-Z]{2}$', region):
+            elif LanguageDescriptionList._regionCodeRegx.match(region):
                 # Valid region
                 linuxRegionList.append(region)
             else:
@@ -359,18 +341,22 @@ class LanguageDescriptionList(JsonHelper):
         """
         windowsIdCodeList = []
         windowsIdCodes = []
+        # Sets of the values already in the lists above, for duplicate checks
+        regionsSeen = set()
+        winIdsSeen = set()
         print ("Enter Windows LANGID values. A value of 0 will exit.")
         while (True):
             region = int(input("LANGID value: "))
             if region == 0:
                 break
             else:
-                if region > 0x0FF:
-                    if region not in windowsIdCodeList:
-                        windowsIdCodeList.append(region)
+                if (region > 0x0FF) and (region not in regionsSeen):
+                    regionsSeen.add(region)
+                    windowsIdCodeList.append(region)
 
                 winId = region & 0x0FF
-                if winId not in windowsIdCodes:
+                if winId not in winIdsSeen:
+                    winIdsSeen.add(winId)
                     windowsIdCodes.append(winId)
         return windowsIdCodes, windowsIdCodeList
 
@@ -397,15 +383,13 @@ class LanguageDescriptionList(JsonHelper):
             # Print entry for user to inspect
             print("New Entry:")
             print(newEntry)
-            commit = input("Is this correct? [Y/N]").upper()
-            if ((commit == 'Y') or (commit == "YES")):
-                entryCorrect = True
+            entryCorrect = self._inputConfirm("Is this correct? [Y/N]")
 
 
         # Determine if it's an overwrite or addition
-        commitFlag = self._getCommitFlag(name, self.langJsonData['languages'].keys(), override)
+        commitFlag = self._commitEntry(self.langJsonData['languages'], name, newEntry, override)
         if commitFlag:
-            self.langJsonData['languages'][name] = newEntry
+            self.langDataDirty = True
 
         return commitFlag
 
@@ -419,12 +403,10 @@ def PrintLanguages(languages:LanguageDescriptionList):
     @param languages (LanguageDescriptionList) - Object to output
     """
     jsonLangData = languages.langJsonData
-    for langName, langData in jsonLangData['languages'].items():
-        print (langName+": {")
-        print (langData)
-        print ("} end "+langName)
-
-    print ("Default = "+jsonLangData['default']['name'])
+    outputLines = [f"{langName}: {{\n{langData}\n}} end {langName}\n"
+                   for langName, langData in jsonLangData['languages'].items()]
+    outputLines.append("Default = "+jsonLangData['default']['name']+"\n")
+    print ("".join(outputLines), end="")
 
 def AddLanguage(languages:LanguageDescriptionList):
     """!
@@ -436,6 +418,23 @@ def AddLanguage(languages:LanguageDescriptionList):
         print ("Updating JSON file")
         languages.update()
 
+def SetDefaultLanguage(languages:LanguageDescriptionList):
+    """!
+    @brief Set the default language of the LanguageDescriptionList file
+    @param languages (LanguageDescriptionList) - Object to set the default language of
+    """
+    defaultLang = languages._inputLanguageName()
+    languages.setDefault(defaultLang)
+    languages.update()
+
+def CreateNewLanguageFile(languages:LanguageDescriptionList):
+    """!
+    @brief Write the LanguageDescriptionList file, even if nothing has changed
+    @param languages (LanguageDescriptionList) - Object to write
+    """
+    languages.langDataDirty = True
+    languages.update()
+
 def CommandMain():
     """!
     Utility command interface
@@ -444,28 +443,23 @@ def CommandMain():
     import argparse
     import pathlib
 
+    commandHandlers = {'add': AddLanguage,
+                       'print': PrintLanguages,
+                       'createnew': CreateNewLanguageFile,
+                       'setdefaultlang': SetDefaultLanguage}
+
     parser = argparse.ArgumentParser(prog="jsonLanguageDescriptionList",
                                      description="Update argpaser library language description JSON file")
     parser.add_argument('-l','--langlist', dest='jsonPathFile', required=True, type=pathlib.Path,
                         default='../data', help='Path/filename of existing or new JSON language description file')
-    parser.add_argument('subcommand', choices=['add', 'print', 'createnew', 'setdefaultlang'],
+    parser.add_argument('subcommand', choices=list(commandHandlers),
                         help='Use one of the valid defined subcommands [add|print|createnew|setdefaultlang]')
 
     args = parser.parse_args()
     jsonLangFile = LanguageDescriptionList(args.jsonPathFile)
 
-    if args.subcommand.lower() == "add":
-        AddLanguage(jsonLangFile)
-    elif args.subcommand.lower() == "print":
-        PrintLanguages(jsonLangFile)
-    elif args.subcommand.lower() == "createnew":
-        jsonLangFile.update()
-    elif args.subcommand.lower() == "setdefaultlang":
-        defaultLang = jsonLangFile._inputLanguageName()
-        jsonLangFile.setDefault(defaultLang)
-    else:
-        print ("Error: Unknown JSON language description file command: "+args.subcommand)
-        SystemExit(1)
+    # argparse choices guarantees the subcommand is a handler key
+    commandHandlers[args.subcommand](jsonLangFile)
 
 if __name__ == '__main__':
     CommandMain()
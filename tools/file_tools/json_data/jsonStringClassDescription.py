@@ -26,7 +26,8 @@ for the argparse libraries
 #==========================================================================
 
 import re
-import json
+import hashlib
+import threading
 
 from .jsonHelper import JsonHelper
 from .param_return_tools import ParamRetDict
@@ -36,9 +37,23 @@ class TranslationTextParser(object):
     """!
     Translation text helper functions
     """
-    parsedTypeText    = 'text'
-    parsedTypeParam   = 'param'
-    parsedTypeSpecial = 'special'
+    parsedTypeText:int    = 0
+    parsedTypeParam:int   = 1
+
+    # Separate special character entries are only found in data files
+    # written by older versions, convertLegacyTypes() folds them into text
+    parsedTypeSpecial:int = 2
+
+    # Type tags used by data files written before the integer tags
+    _legacyTypeTags = {'text': parsedTypeText, 'param': parsedTypeParam, 'special': parsedTypeSpecial}
+
+    # assembleParsedStrData (prefix, suffix) wrapper for each type
+    _assembleWrappers = {parsedTypeText: ("", ""), parsedTypeParam: ("@", "@")}
+
+    # Escape text for use inside a quoted code string
+    _escapeTable = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+    _paramRegx = re.compile(r'@[a-zA-Z_][a-zA-Z0-9_]*@')
 
     def __init__(self):
         pass
@@ -47,10 +62,6 @@ class TranslationTextParser(object):
     def makeTextEntry(textBlock:str)->tuple:
         return (TranslationTextParser.parsedTypeText, textBlock)
 
-    @staticmethod
-    def makeSpecialCharEntry(textBlock:str)->tuple:
-        return (TranslationTextParser.parsedTypeSpecial, textBlock[0])
-
     @staticmethod
     def makeParamEntry(paramName:str)->tuple:
         return (TranslationTextParser.parsedTypeParam, paramName)
@@ -62,26 +73,10 @@ class TranslationTextParser(object):
         @param baseString {string} String to convert
         @return list of dictionaries - List of dictionary entries descibing the parsed string
         """
-        matchList = re.finditer(r'\\|\"', textBlock)
-
-        stringList = []
-        previousEnd = 0
-        for matchData in matchList:
-            # Add text data prior to first match if any
-            if matchData.start() > previousEnd:
-                rawText = r'{}'.format(textBlock[previousEnd:matchData.start()])
-                stringList.append(TranslationTextParser.makeTextEntry(rawText))
-
-            # Add the matched parameter
-            stringList.append(TranslationTextParser.makeSpecialCharEntry(matchData.group()))
-            previousEnd = matchData.end()
-
-        # Add the trailing string
-        if previousEnd < len(textBlock):
-            rawText = r'{}'.format(textBlock[previousEnd:])
-            stringList.append(TranslationTextParser.makeTextEntry(rawText))
-
-        return stringList
+        if textBlock:
+            return [TranslationTextParser.makeTextEntry(textBlock)]
+        else:
+            return []
 
     @staticmethod
     def parseTranslateString(baseString:str)->list:
@@ -93,24 +88,28 @@ class TranslationTextParser(object):
                                  tuple[1] = data, if TranslationTextParser.parsedTypeText = text string
                                                   if TranslationTextParser.parsedTypeParam = parameter name
         """
-        matchList = re.finditer(r'@[a-zA-Z_][a-zA-Z0-9_]*@', baseString)
+        # Most strings have no parameters, skip the scan for those
+        if '@' not in baseString:
+            return TranslationTextParser.parseTextBlock(baseString)
+
+        makeText = TranslationTextParser.makeTextEntry
+        makeParam = TranslationTextParser.makeParamEntry
+        matchList = TranslationTextParser._paramRegx.finditer(baseString)
 
         stringList = []
         previousEnd = 0
         for matchData in matchList:
             # Add text data prior to first match if any
             if matchData.start() > previousEnd:
-                rawText = r'{}'.format(baseString[previousEnd:matchData.start()])
-                stringList.extend(TranslationTextParser.parseTextBlock(rawText))
+                stringList.append(makeText(baseString[previousEnd:matchData.start()]))
 
             # Add the matched parameter
-            stringList.append(TranslationTextParser.makeParamEntry(matchData.group()[1:-1]))
+            stringList.append(makeParam(matchData.group()[1:-1]))
             previousEnd = matchData.end()
 
         # Add the trailing string
         if previousEnd < len(baseString):
-            rawText = r'{}'.format(baseString[previousEnd:])
-            stringList.extend(TranslationTextParser.parseTextBlock(rawText))
+            stringList.append(makeText(baseString[previousEnd:]))
 
         return stringList
 
@@ -121,20 +120,17 @@ class TranslationTextParser(object):
         @param stringTupleList (list) List of string description tuples
         @return string - Assempled text string ready for input into a language translation engine
         """
-        returnText = ""
+        wrappers = TranslationTextParser._assembleWrappers
+
+        textParts = []
         for descType, descData in stringTupleList:
-            if TranslationTextParser.parsedTypeText == descType:
-                returnText += descData
-            elif TranslationTextParser.parsedTypeParam == descType:
-                returnText += '@'
-                returnText += descData
-                returnText += '@'
-            elif TranslationTextParser.parsedTypeSpecial == descType:
-                returnText += descData
-            else:
-                raise TypeError("Unknown string description tuple type: "+descType)
+            try:
+                prefix, suffix = wrappers[descType]
+            except KeyError:
+                raise TypeError("Unknown string description tuple type: "+str(descType)) from None
+            textParts.append(prefix+descData+suffix)
 
-        return returnText
+        return "".join(textParts)
 
     @staticmethod
     def assembleStream(stringTupleList:list, streamOperator:str = "<<")->str:
@@ -144,39 +140,33 @@ class TranslationTextParser(object):
         @param streamOperator (string) Language specific stream operator
         @return string - Assempled text string ready for input into a language translation engine
         """
-        returnText = ""
-        stringOpen = False
+        textType = TranslationTextParser.parsedTypeText
+        paramType = TranslationTextParser.parsedTypeParam
+        escapeTable = TranslationTextParser._escapeTable
+        openString = " "+streamOperator+" \""
+        closeString = "\" "+streamOperator+" "
 
+        textParts = []
+        stringOpen = False
         for descType, descData in stringTupleList:
-            if TranslationTextParser.parsedTypeText == descType:
+            if textType == descType:
                 if not stringOpen:
-                    returnText += " "
-                    returnText += streamOperator
-                    returnText += " \""
+                    textParts.append(openString)
                     stringOpen = True
-                returnText += descData
-            elif TranslationTextParser.parsedTypeParam == descType:
+                textParts.append(descData.translate(escapeTable))
+            elif paramType == descType:
                 if stringOpen:
-                    returnText += "\" "
-                    returnText += streamOperator
-                    returnText += " "
+                    textParts.append(closeString)
                     stringOpen = False
-                returnText += descData
-            elif TranslationTextParser.parsedTypeSpecial == descType:
-                if not stringOpen:
-                    returnText += " "
-                    returnText += streamOperator
-                    returnText += " \""
-                    stringOpen = True
-                returnText += "\\"+descData
+                textParts.append(descData)
             else:
-                raise TypeError("Unknown string description tuple type: "+descType)
+                raise TypeError("Unknown string description tuple type: "+str(descType))
 
         # Close the open string if present
         if stringOpen:
-            returnText += "\""
+            textParts.append("\"")
             stringOpen = False
-        return returnText
+        return "".join(textParts)
 
     @staticmethod
     def assembleTestReturnString(stringTupleList:list, valueXlateDict:dict)->str:
@@ -187,18 +177,45 @@ class TranslationTextParser(object):
         @return string - Assempled text string ready for input into a language translation
                          expected string
         """
-        returnText = ""
+        textType = TranslationTextParser.parsedTypeText
+        paramType = TranslationTextParser.parsedTypeParam
+        escapeTable = TranslationTextParser._escapeTable
+
+        textParts = []
         for descType, descData in stringTupleList:
-            if TranslationTextParser.parsedTypeText == descType:
-                returnText += descData
-            elif TranslationTextParser.parsedTypeParam == descType:
+            if textType == descType:
+                textParts.append(descData.translate(escapeTable))
+            elif paramType == descType:
                 value, isText = valueXlateDict[descData]
-                returnText += value
-            elif TranslationTextParser.parsedTypeSpecial == descType:
-                returnText += "\\"+descData
+                textParts.append(value)
             else:
-                raise TypeError("Unknown string description tuple type: "+descType)
-        return returnText
+                raise TypeError("Unknown string description tuple type: "+str(descType))
+        return "".join(textParts)
+
+    @staticmethod
+    def convertLegacyTypes(stringTupleList:list)->list:
+        """!
+        @brief Convert a parsed string description list written by an older version
+               to the integer type tags and merge special character entries into
+               the surrounding text entries
+        @param stringTupleList (list) List of string description tuples
+        @return list of tuples - Converted string description tuple list
+        """
+        legacyTags = TranslationTextParser._legacyTypeTags
+        textType = TranslationTextParser.parsedTypeText
+        specialType = TranslationTextParser.parsedTypeSpecial
+
+        convertedList = []
+        for descType, descData in stringTupleList:
+            descType = legacyTags.get(descType, descType)
+            if descType == specialType:
+                descType = textType
+
+            if (descType == textType) and convertedList and (convertedList[-1][0] == textType):
+                convertedList[-1] = (textType, convertedList[-1][1]+descData)
+            else:
+                convertedList.append((descType, descData))
+        return convertedList
 
     @staticmethod
     def isParsedTextType(parsedTuple:list)->bool:
@@ -207,10 +224,7 @@ class TranslationTextParser(object):
         @return boolean - True if tuple[0] == TranslationTextParser.parsedTypeText
                           else False
         """
-        if parsedTuple[0] == TranslationTextParser.parsedTypeText:
-            return True
-        else:
-            return False
+        return parsedTuple[0] == TranslationTextParser.parsedTypeText
 
     @staticmethod
     def isParsedParamType(parsedTuple:list)->bool:
@@ -219,10 +233,7 @@ class TranslationTextParser(object):
         @return boolean - True if tuple[0] == TranslationTextParser.parsedTypeParam
                           else False
         """
-        if parsedTuple[0] == TranslationTextParser.parsedTypeParam:
-            return True
-        else:
-            return False
+        return parsedTuple[0] == TranslationTextParser.parsedTypeParam
 
     @staticmethod
     def getParsedStrData(parsedTuple:list)->bool:
@@ -237,6 +248,22 @@ class StringClassDescription(JsonHelper):
     """!
     String object class definitions
     """
+    __slots__ = ('filename', '_stringJasonData', 'stringDataDirty', 'transClient', 'transClientLock',
+                 'propertyNameIndex', 'translationCacheFile', 'translationCache', 'translationCacheDirty')
+
+    _maxTranslateBatch = 128    # Maximum text strings per Google translate v2 request
+    _maxTranslateThreads = 8    # Maximum concurrent Google translate requests
+
+    # User input validity checks
+    _isoCodeRegx = re.compile(r'^[a-z]{2}\Z')
+    _codeNameRegx = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*\Z')
+    _codeTypeRegx = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_:]*\Z')
+
+    # _inputParamReturnType() menu selection -> base type name
+    _baseTypeMenu = {'s': "size",     'size': "size",
+                     't': "string",   'text': "string",
+                     'i': "integer",  'integer': "integer",
+                     'u': "unsigned", 'unsigned': "unsigned"}
 
     def __init__(self, stringDefFileName:str = None):
         """!
@@ -249,19 +276,45 @@ class StringClassDescription(JsonHelper):
             self.filename = "jsonStringClassDescription.json"
         else:
             self.filename = stringDefFileName
-        try:
-            langJsonFile = open(self.filename, 'r', encoding='utf-8')
-        except FileNotFoundError:
-            self.stringJasonData = {'baseClassName': "baseclass",
-                                    'namespace': "myNamespace",
-                                    'dynamicCompileSwitch': "DYNAMIC_INTERNATIONALIZATION",
-                                    'propertyMethods':{},
-                                    'translateMethods':{}}
-        else:
-            self.stringJasonData = json.load(langJsonFile)
-            langJsonFile.close()
+        self._stringJasonData = None   # read only if and when we need it
+        self.stringDataDirty = False   # True if update() needs to write the file
 
         self.transClient = None  # open it only if and when we need it
+        self.transClientLock = threading.Lock()
+        self.propertyNameIndex = None  # property name -> first property method name, built on first use
+
+        # Previously translated text, loaded only if and when we need it
+        self.translationCacheFile = str(self.filename)+".translate_cache.json"
+        self.translationCache = None
+        self.translationCacheDirty = False
+
+    @property
+    def stringJasonData(self)->dict:
+        """!
+        @brief String class description data, read from self.filename on first use
+        @return dictionary - String class description data
+        """
+        if self._stringJasonData is None:
+            try:
+                self._stringJasonData = self.readJsonFile(self.filename)
+            except FileNotFoundError:
+                self._stringJasonData = {'baseClassName': "baseclass",
+                                         'namespace': "myNamespace",
+                                         'dynamicCompileSwitch': "DYNAMIC_INTERNATIONALIZATION",
+                                         'propertyMethods':{},
+                                         'translateMethods':{}}
+                self.stringDataDirty = True   # File does not exist yet, update() must create it
+            else:
+                # Upgrade translation text stored with the old text type tags
+                for methodData in self._stringJasonData['translateMethods'].values():
+                    translateDesc = methodData['translateDesc']
+                    for langCode, textData in translateDesc.items():
+                        convertedData = TranslationTextParser.convertLegacyTypes(textData)
+                        if ((len(convertedData) != len(textData)) or
+                            any(newEntry[0] != oldEntry[0] for newEntry, oldEntry in zip(convertedData, textData))):
+                            self.stringDataDirty = True   # Write the upgraded data back out
+                        translateDesc[langCode] = convertedData
+        return self._stringJasonData
 
     def setBaseClassName(self, className:str):
         """!
@@ -269,6 +322,7 @@ class StringClassDescription(JsonHelper):
         @param className {string} Base class name for the methods
         """
         self.stringJasonData['baseClassName'] = className
+        self.stringDataDirty = True
 
     def getBaseClassName(self)->str:
         """!
@@ -309,12 +363,14 @@ class StringClassDescription(JsonHelper):
 
     def setNamespaceName(self, namespace:str):
         self.stringJasonData['namespace'] = namespace
+        self.stringDataDirty = True
 
     def getNamespaceName(self):
         return self.stringJasonData['namespace']
 
     def setDynamicCompileSwitch(self, switch:str):
         self.stringJasonData['dynamicCompileSwitch'] = switch
+        self.stringDataDirty = True
 
     def getDynamicCompileSwitch(self):
         return self.stringJasonData['dynamicCompileSwitch']
@@ -348,19 +404,22 @@ class StringClassDescription(JsonHelper):
         @brief Get the get ISO 639-1 code method name
         @return string - Get ISO code method name
         """
-        propertyMethodList = self.getPropertyMethodList()
-        for methodName in propertyMethodList:
-            if self.stringJasonData['propertyMethods'][methodName]['name'] == 'isoCode':
-                return methodName
+        if self.propertyNameIndex is None:
+            self.propertyNameIndex = {}
+            for methodName, methodData in self.stringJasonData['propertyMethods'].items():
+                self.propertyNameIndex.setdefault(methodData['name'], methodName)
 
-        return LanguageDescriptionList.getLanguageIsoPropertyMethodName()
+        methodName = self.propertyNameIndex.get('isoCode')
+        if methodName is None:
+            methodName = LanguageDescriptionList.getLanguageIsoPropertyMethodName()
+        return methodName
 
     def getPropertyMethodList(self)->list:
         """!
         @brief Return a list of property method name strings
         @return list of strings - Names of the property methods
         """
-        return list(self.stringJasonData['propertyMethods'].keys())
+        return list(self.stringJasonData['propertyMethods'])
 
     def getPropertyMethodData(self, methodName:str)->tuple:
         """!
@@ -373,15 +432,6 @@ class StringClassDescription(JsonHelper):
         entry = self.stringJasonData['propertyMethods'][methodName]
         return entry['name'], entry['briefDesc'], entry['params'], entry['return']
 
-    def _defineTranslationDict(self, translateBaseLang:str = "en", translateText:list = None)->dict:
-        """!
-        @brief Create a translation dictionary
-        @param translateBaseLang {string} ISO 639-1 language code for the input translateText string
-        @param translateText {list} Parsed text of the message
-        @return dictionary - {'base':<translateBaseLang>, 'text':<translateText>} Translate method translation string dictionary
-        """
-        return {translateBaseLang: translateText}
-
     def addManualTranslation(self, methodName:str, baseLang:str = "en", textData:list = None)->bool:
         """!
         @brief Add language text to the function definition
@@ -390,15 +440,96 @@ class StringClassDescription(JsonHelper):
         @param textData {list} Parsed text of the message
         @return boolean - True if it was added, else false
         """
-        if methodName in self.stringJasonData['translateMethods']:
+        methodEntry = self.stringJasonData['translateMethods'].get(methodName)
+        if methodEntry is not None:
             if textData is not None:
-                self.stringJasonData['translateMethods'][methodName]['translateDesc'][baseLang] = textData
+                methodEntry['translateDesc'][baseLang] = textData
+                self.stringDataDirty = True
                 return True
             else:
                 return False
         else:
             return False
 
+    def _translateTextList(self, sourceLang:str, targetLang:str, textList:list)->list:
+        """!
+        @brief Translate a list of text strings, batching the strings into as few
+               translate requests as possible
+        @param sourceLang {string} ISO 639-1 language code of the input text
+        @param targetLang {string} ISO 639-1 language code for the output text
+        @param textList {list of strings} text strings to translate
+        @return list of strings - Translated text, in textList order
+        """
+        translationCache = self._getTranslationCache()
+        cacheKeyList = [self._getTranslationCacheKey(sourceLang, targetLang, text) for text in textList]
+
+        # Only translate the text that is not already in the cache
+        missingTextDict = {}
+        for cacheKey, text in zip(cacheKeyList, textList):
+            if cacheKey not in translationCache:
+                missingTextDict[cacheKey] = text
+
+        if missingTextDict:
+            transClient = self._getTranslateClient()
+            missingKeyList = list(missingTextDict)
+            batchSize = StringClassDescription._maxTranslateBatch
+            for batchStart in range(0, len(missingKeyList), batchSize):
+                batchKeyList = missingKeyList[batchStart:batchStart+batchSize]
+                translatedTextData = transClient.translate([missingTextDict[cacheKey] for cacheKey in batchKeyList],
+                                                                target_language=targetLang,
+                                                                format_='text',
+                                                                source_language=sourceLang,
+                                                                model='nmt')
+                for cacheKey, textData in zip(batchKeyList, translatedTextData):
+                    translationCache[cacheKey] = textData['translatedText']
+            self.translationCacheDirty = True
+
+        return [translationCache[cacheKey] for cacheKey in cacheKeyList]
+
+    def _getTranslateClient(self):
+        """!
+        @brief Get the Google translate client, opening it on first use
+        @return translate.Client - Translate client object
+        """
+        with self.transClientLock:
+            if self.transClient is None:
+                # Imported here rather than at module load so the commands that
+                # never translate (build, print, property updates) do not load the
+                # slow google cloud library.  This block only runs when the client
+                # is first opened, so the import still happens once per run.
+                try:
+                    from google.cloud import translate_v2 as translate
+                except ImportError as importError:
+                    raise ImportError("google-cloud-translate is required to generate translations") from importError
+                self.transClient = translate.Client()
+        return self.transClient
+
+    def _getTranslationCache(self)->dict:
+        """!
+        @brief Get the translation cache, reading the cache file on first use
+        @return dictionary - Translation cache key -> translated text
+        """
+        # Locked, the translate worker threads must all share one cache dictionary
+        with self.transClientLock:
+            if self.translationCache is None:
+                try:
+                    self.translationCache = self.readJsonFile(self.translationCacheFile)
+                except FileNotFoundError:
+                    self.translationCache = {}
+        return self.translationCache
+
+    @staticmethod
+    def _getTranslationCacheKey(sourceLang:str, targetLang:str, text:str)->str:
+        """!
+        @brief Get the translation cache key for the input text
+        @param sourceLang {string} ISO 639-1 language code of the input text
+        @param targetLang {string} ISO 639-1 language code for the output text
+        @param text {string} text to translate
+        @return string - Cache key
+        """
+        keyData = sourceLang+"\x00"+targetLang+"\x00"+text
+        return hashlib.blake2b(keyData.encode("utf-8"), digest_size=16).hexdigest()
+
     def _translateText(self, sourceLang:str, targetLang:str, text:str)->str:
         """!
         @brief Translate the input text
@@ -407,20 +538,58 @@ class StringClassDescription(JsonHelper):
         @param text {string} text to translate
         @return string - Translated text
         """
-        from google.cloud import translate_v2 as translate
-        if self.transClient is None:
-            self.transClient = translate.Client()
-
         if isinstance(text, bytes):
             text = text.decode("utf-8")
+        return self._translateTextList(sourceLang, targetLang, [text])[0]
 
-        translatedTextData = self.transClient.translate(text,
-                                                        target_language=targetLang,
-                                                        format_='text',
-                                                        source_language=sourceLang,
-                                                        model='nmt')
-        rawTranslatedText = translatedTextData['translatedText']
-        return rawTranslatedText
+    def _translateMissingText(self, methodNameList:list, jsonLangData:LanguageDescriptionList = None):
+        """!
+        @brief Add missing language text to the function definitions.  One translate
+               request is made for each source/target language pair, not for each method.
+        @param methodNameList {list of strings} Translation method names to add the language text to
+        @param jsonLangData {LanguageDescriptionList} Language list data
+        """
+        if jsonLangData is None:
+            return
+
+        translateMethods = self.stringJasonData['translateMethods']
+        langIsoCodes = dict.fromkeys([jsonLangData.getLanguageIsoCodeData(language)
+                                      for language in jsonLangData.getLanguageList()])
+
+        # Group the missing translations by (source language, target language)
+        translateGroups = {}
+        for methodName in methodNameList:
+            translateDesc = translateMethods[methodName]['translateDesc']
+            missingIsoCodes = [langIsoCode for langIsoCode in langIsoCodes if langIsoCode not in translateDesc]
+            if missingIsoCodes:
+                # Use the first language, assembled once for all of the target languages
+                sourceLanguage = next(iter(translateDesc))
+                sourceText = TranslationTextParser.assembleParsedStrData(translateDesc[sourceLanguage])
+                for langIsoCode in missingIsoCodes:
+                    translateGroups.setdefault((sourceLanguage, langIsoCode), []).append((translateDesc, sourceText))
+
+        if not translateGroups:
+            return
+
+        # Translate the groups concurrently, the requests are network bound.
+        # Load the shared cache before the worker threads start, the client is
+        # only opened (under the lock) if a worker finds uncached text.
+        from concurrent.futures import ThreadPoolExecutor
+        self._getTranslationCache()
+        def translateGroup(groupItem:tuple)->list:
+            (sourceLanguage, langIsoCode), groupEntries = groupItem
+            return self._translateTextList(sourceLanguage, langIsoCode,
+                                           [sourceText for translateDesc, sourceText in groupEntries])
+
+        groupList = list(translateGroups.items())
+        with ThreadPoolExecutor(max_workers=StringClassDescription._maxTranslateThreads) as executor:
+            translatedGroupList = list(executor.map(translateGroup, groupList))
+
+        # Parse the results for storage
+        for ((sourceLanguage, langIsoCode), groupEntries), translatedTextList in zip(groupList, translatedGroupList):
+            for (translateDesc, sourceText), translatedText in zip(groupEntries, translatedTextList):
+                translateDesc[langIsoCode] = TranslationTextParser.parseTranslateString(translatedText)
+        self.stringDataDirty = True
 
     def _translateMethodText(self, methodName:str, jsonLangData:LanguageDescriptionList = None):
         """!
@@ -428,29 +597,9 @@ class StringClassDescription(JsonHelper):
         @param methodName {string} Translation method name to add the language text to
         @param jsonLangData {LanguageDescriptionList} Language list data
         """
-        if jsonLangData is not None:
-            # Get the list of supported languages and the list of existing translations
-            languageList = jsonLangData.getLanguageList()
-            existingLangages = list(self.stringJasonData['translateMethods'][methodName]['translateDesc'])
-
-            # Determine if any language translations are missing
-            for language in languageList:
-                langIsoCode = jsonLangData.getLanguageIsoCodeData(language)
-                if langIsoCode not in existingLangages:
-                    # Use the first language
-                    sourceLanguage = existingLangages[0]
-                    baseTextData = self.stringJasonData['translateMethods'][methodName]['translateDesc'][sourceLanguage]
-                    sourceText = TranslationTextParser.assembleParsedStrData(baseTextData)
-
-                    # Translate and parse for storage
-                    translatedText = self._translateText(sourceLanguage, langIsoCode, sourceText)
-                    translatedTextData = TranslationTextParser.parseTranslateString(translatedText)
-                    self.stringJasonData['translateMethods'][methodName]['translateDesc'][langIsoCode] = translatedTextData
-        else:
-            pass
-
+        self._translateMissingText([methodName], jsonLangData)
 
-    def _defineTranslateFunctionEntry(self, briefDesc:str = "", paramsList:list = [], retDict:dict = {},
+    def _defineTranslateFunctionEntry(self, briefDesc:str = "", paramsList:list = None, retDict:dict = None,
                                       translateBaseLang:str = "en", translateText:list = None)->dict:
         """!
         @brief Define a property string return function dictionary and
@@ -458,8 +607,9 @@ class StringClassDescription(JsonHelper):
 
         @param briefDesc {string} Brief description of the function used in
                                   doxygen comment block generation
-        @param paramsList {list of dictionaries} List of the function parameter dictionary entrys
-        @param retDict {dict} Return data dictionary
+        @param paramsList {list of dictionaries|None} List of the function parameter dictionary entrys,
+                                                      the entry gets its own copy of the list
+        @param retDict {dict|None} Return data dictionary, the entry gets its own copy of the dictionary
         @param translateBaseLang {string} ISO 639-1 language code for the input translateText string
         @param translateText {list} Parsed text of the message
 
@@ -467,19 +617,22 @@ class StringClassDescription(JsonHelper):
                  'return':ParamRetDict.buildReturnDict('text', retDesc, False),
                  'translateDesc': {'base':<string> 'text':<string>}} Translate function dictionary
         """
-        functionDict = {'briefDesc': briefDesc,
-                        'params': paramsList,
-                        'return': retDict,
-                        'translateDesc': self._defineTranslationDict(translateBaseLang, translateText)
-                        }
-        return functionDict
+        # Use new containers, not shared default or caller objects
+        paramsList = list(paramsList) if paramsList is not None else []
+        retDict = dict(retDict) if retDict is not None else {}
+
+        return {'briefDesc': briefDesc,
+                'params': paramsList,
+                'return': retDict,
+                'translateDesc': {translateBaseLang: translateText}
+                }
 
     def getTranlateMethodList(self)->list:
         """!
         @brief Return a list of property method name strings
         @return list of strings - Names of the property methods
         """
-        return list(self.stringJasonData['translateMethods'].keys())
+        return list(self.stringJasonData['translateMethods'])
 
     def getTranlateMethodFunctionData(self, methodName:str)->tuple:
         """!
@@ -500,6 +653,30 @@ class StringClassDescription(JsonHelper):
         """
         return self.stringJasonData['translateMethods'][methodName]['translateDesc'][targetLanguage]
 
+    @staticmethod
+    def _inputInt(promptText:str, minValue:int = 0, maxValue:int|None = None)->int:
+        """!
+        @brief Prompt the user until a valid integer value is entered
+        @param promptText {string} Input prompt text
+        @param minValue {number} Minimum valid value
+        @param maxValue {number|None} Maximum valid value or None if there is no maximum
+        @return number - Validated input value
+        """
+        if maxValue is None:
+            rangeText = str(minValue)+" or greater"
+        else:
+            rangeText = str(minValue)+" to "+str(maxValue)
+
+        while True:
+            try:
+                value = int(input(promptText))
+            except ValueError:
+                value = None
+
+            if (value is not None) and (value >= minValue) and ((maxValue is None) or (value <= maxValue)):
+                return value
+            print ("Valid input values are "+rangeText+", try again")
+
     def _inputIsoTranslateCode(self)->str:
         """!
         @brief Get the ISO 639-1 translate language code from user input and check for validity
@@ -510,7 +687,7 @@ class StringClassDescription(JsonHelper):
             transId = input("Enter original string ISO 639-1 translate language code (2 lower case characters): ").lower()
 
             # Check validity
-            if re.match('^[a-z]{2}$', transId):
+            if StringClassDescription._isoCodeRegx.match(transId):
                 # Valid name
                 isoTranslateId = transId
             else:
@@ -524,16 +701,16 @@ class StringClassDescription(JsonHelper):
         @param methodName {boolean} True if this is a method name call, else False (default)
         @return string - Validated name value
         """
-        validatedName = ""
-        while(validatedName == ""):
+        paramName = ""
+        while(paramName == ""):
             if methodName:
                 name = input("Enter method name: ")
             else:
                 name = input("Enter parameter name: ")
-            name.strip()
+            name = name.strip()
 
             # Check validity
-            if re.match('^[a-zA-Z_][a-zA-Z0-9_]*$', name):
+            if StringClassDescription._codeNameRegx.match(name):
                 # Valid name
                 paramName = name
             else:
@@ -560,18 +737,12 @@ class StringClassDescription(JsonHelper):
             inputType = input(promptStr+" [T(ext)|i(nteger)|u(nsigned)|s(ize)|c(ustom)]: ").lower()
 
             # Check validity
-            if (inputType == "s") or (inputType=="size"):
-                varType = "size"
-            elif (inputType == "t") or (inputType=="text"):
-                varType = "string"
-            elif (inputType == "i") or (inputType=="integer"):
-                varType = "integer"
-            elif (inputType == "u") or (inputType=="unsigned"):
-                varType = "unsigned"
+            if inputType in StringClassDescription._baseTypeMenu:
+                varType = StringClassDescription._baseTypeMenu[inputType]
             elif (inputType == "c") or (inputType=="custom"):
                 print ("Note: Custom type must have an operator<< defined.")
                 customType = input("Enter custom type: ")
-                if re.match('^[a-zA-Z_][a-zA-Z0-9_:]*$', customType):
+                if StringClassDescription._codeTypeRegx.match(customType):
                     # valid
                     varType = customType
                 else:
@@ -581,23 +752,9 @@ class StringClassDescription(JsonHelper):
                 # invalid name
                 print("Error: \""+inputType+"\" unknown. Please select one of the options from the menu.")
 
-        isListType = input("Is full type a list [y/n]:").lower()
-        if (isListType == 'y') or (isListType == 'yes'):
-            isList = True
-        else:
-            isList = False
-
-        isPtrType = input("Is full type a pointer [y/n]:").lower()
-        if (isPtrType == 'y') or (isPtrType == 'yes'):
-            isPtr = True
-        else:
-            isPtr = False
-
-        isRefType = input("Is full type a reference [y/n]:").lower()
-        if (isRefType == 'y') or (isRefType == 'yes'):
-            isReference = True
-        else:
-            isReference = False
+        isList = self._inputConfirm("Is full type a list [y/n]:")
+        isPtr = self._inputConfirm("Is full type a pointer [y/n]:")
+        isReference = self._inputConfirm("Is full type a reference [y/n]:")
 
         return varType, isList, isReference, isPtr
 
@@ -620,12 +777,22 @@ class StringClassDescription(JsonHelper):
         retDesc = input("Enter brief description of the return value for doxygen comment: ")
         return ParamRetDict.buildReturnDict(returnType, retDesc, isList, isReference, isPtr)
 
-    def update(self):
+    def update(self, prettyPrint:bool = True):
         """!
-        @brief Update the JSON file with the current contents of self.langJsonData
+        @brief Update the JSON file with the current contents of self.stringJasonData,
+               if the data has changed since it was last read or written
+        @param prettyPrint {boolean} True = indented output, False = compact output
         """
-        with open(self.filename, 'w', encoding='utf-8') as langJsonFile:
-            json.dump(self.stringJasonData, langJsonFile, indent=2)
+        # Reading the data first marks a missing file for creation
+        stringData = self.stringJasonData
+        if self.stringDataDirty:
+            self.writeJsonFile(self.filename, stringData, prettyPrint)
+            self.stringDataDirty = False
+
+        # Save any new translations for the next run
+        if self.translationCacheDirty:
+            self.writeJsonFile(self.translationCacheFile, self.translationCache, False)
+            self.translationCacheDirty = False
 
     def _validateTranslateString(self, paramList:list, testString:str):
         """!
@@ -639,25 +806,23 @@ class StringClassDescription(JsonHelper):
         @return number - Number of matched items
         @return number - Number of parameters found in the input string
         """
-        # Construct the expected list
-        expectedParamList = []
-        for param in paramList:
-            paramName = ParamRetDict.getParamName(param)
-            expectedParamList.append(paramName)
+        # Construct the expected name set
+        expectedParams = {ParamRetDict.getParamName(param) for param in paramList}
 
         # Break the string into it's component parts
         parsedStrData = TranslationTextParser.parseTranslateString(testString)
 
         # Check the broken string counts
+        paramType = TranslationTextParser.parsedTypeParam
         matchCount = 0
         paramCount = 0
-        for parsedData in parsedStrData:
-            if TranslationTextParser.isParsedParamType(parsedData):
+        for descType, descData in parsedStrData:
+            if descType == paramType:
                 paramCount +=1
-                if TranslationTextParser.getParsedStrData(parsedData) in expectedParamList:
+                if descData in expectedParams:
                     matchCount+=1
 
-        if (matchCount == len(expectedParamList)) and (paramCount == matchCount):
+        if (matchCount == len(paramList)) and (paramCount == matchCount):
             # Return success
             return True, matchCount, paramCount, parsedStrData
         else:
@@ -674,15 +839,7 @@ class StringClassDescription(JsonHelper):
         @return string - Validated translation template string
         """
         # Build parameter list help string
-        expectedParamHelp = ""
-        prefix = ""
-        for param in paramList:
-            paramName = ParamRetDict.getParamName(param)
-            expectedParamHelp += prefix
-            expectedParamHelp += '@'
-            expectedParamHelp += paramName
-            expectedParamHelp += '@'
-            prefix = " ,"
+        expectedParamHelp = " ,".join(["@"+ParamRetDict.getParamName(param)+"@" for param in paramList])
 
         # Get the translate string from the user
         stringValid = False
@@ -693,7 +850,7 @@ class StringClassDescription(JsonHelper):
             print("function parameters should be inserted.")
             print("Example with single input parameter name \"keyString\": Found argument key @keyString@")
             translateString = input("String:")
-            stringValid, matchCount, paramCount, parsedString = self._validateTranslateString(translateString)
+            stringValid, matchCount, paramCount, parsedString = self._validateTranslateString(paramList, translateString)
 
             if not stringValid:
                 if (len(paramList) > matchCount) and (len(paramList) > paramCount):
@@ -728,11 +885,8 @@ class StringClassDescription(JsonHelper):
             methodName = self._inputVarMethodName()
             methodDesc = input("Enter brief function description for doxygen comment: ")
 
-            paramList = []
-            paramCount = input("Enter parameter count? [0-n]: ")
-            while(paramCount > 0):
-                paramList.append(self._inputParameterData())
-                paramCount -= 1
+            paramCount = self._inputInt("Enter parameter count? [0-n]: ")
+            paramList = [self._inputParameterData() for paramIndex in range(paramCount)]
 
             returnDict = self._inputReturnData()
 
@@ -743,14 +897,12 @@ class StringClassDescription(JsonHelper):
             # Print entry for user to inspect
             print("New Entry:")
             print(newEntry)
-            commit = input("Is this correct? [Y/N]").upper()
-            if ((commit == 'Y') or (commit == "YES")):
-                entryCorrect = True
+            entryCorrect = self._inputConfirm("Is this correct? [Y/N]")
 
         # Test existing for match
-        commitFlag = self._getCommitFlag(methodName, self.stringJasonData['translateMethods'].keys(), override)
+        commitFlag = self._commitEntry(self.stringJasonData['translateMethods'], methodName, newEntry, override)
         if commitFlag:
-            self.stringJasonData['translateMethods'][methodName] = newEntry
+            self.stringDataDirty = True
             self._translateMethodText(methodName, languageList)
 
         return commitFlag
@@ -777,17 +929,68 @@ class StringClassDescription(JsonHelper):
 
         newEntry = self._defineTranslateFunctionEntry(methodDesc, paramList, returnDict, isoLangCode, parsedStrData)
 
+        translateMethods = self.stringJasonData['translateMethods']
         commitFlag = True
-        if methodName in self.stringJasonData['translateMethods'].keys():
+        if methodName in translateMethods:
+            if (not override) and self._isTranslateEntryUnchanged(translateMethods[methodName], newEntry, isoLangCode):
+                # Keep the matching existing entry and its translations
+                return False
+
             # Determine if we should overwrite existing
             commitFlag = self._getCommitOverWriteFlag(methodName, override)
 
         if commitFlag:
-            self.stringJasonData['translateMethods'][methodName] = newEntry
+            translateMethods[methodName] = newEntry
+            self.stringDataDirty = True
             self._translateMethodText(methodName, languageList)
 
         return commitFlag
 
+    def addTranslateMethodEntries(self, entryList:list, override:bool = False,
+                                  languageList:LanguageDescriptionList = None)->list:
+        """!
+        @brief Add a list of new translate string return function dictionaries
+               to the list of translate functions and translate all of them together
+        @param entryList {list of tuples} (methodName, methodDesc, paramList/paramTuple, returnDict,
+                                           isoLangCode, translateString) addTranslateMethodEntry()
+                                           input data for each entry
+        @param override {boolean} True = Override existing without asking
+        @param languageList {LanguageDescriptionList | None} Supported language description data or None
+        @return list of strings - Names of the methods that were added
+        """
+        addedMethodList = []
+        for methodName, methodDesc, paramList, returnDict, isoLangCode, translateString in entryList:
+            if self.addTranslateMethodEntry(methodName, methodDesc, paramList, returnDict,
+                                            isoLangCode, translateString, override):
+                addedMethodList.append(methodName)
+
+        # Unchanged existing entries may still be missing newly added languages
+        translateMethods = self.stringJasonData['translateMethods']
+        self._translateMissingText([entry[0] for entry in entryList if entry[0] in translateMethods], languageList)
+        return addedMethodList
+
+    @staticmethod
+    def _isTranslateEntryUnchanged(existingEntry:dict, newEntry:dict, isoLangCode:str)->bool:
+        """!
+        @brief Determine if an existing translate method entry matches the new entry definition
+        @param existingEntry {dictionary} Existing translate method dictionary
+        @param newEntry {dictionary} New translate method dictionary
+        @param isoLangCode {string} ISO 639-1 language code of the new entry translate string
+        @return boolean - True if the description, parameters, return and isoLangCode
+                          text match, else False
+        """
+        if ((existingEntry['briefDesc'] != newEntry['briefDesc']) or
+            (existingEntry['params'] != newEntry['params']) or
+            (existingEntry['return'] != newEntry['return'])):
+            return False
+
+        # Parsed text read from the JSON file is stored as lists, new parsed text as tuples
+        existingText = existingEntry['translateDesc'].get(isoLangCode)
+        if existingText is None:
+            return False
+        newText = newEntry['translateDesc'][isoLangCode]
+        return [tuple(textEntry) for textEntry in existingText] == [tuple(textEntry) for textEntry in newText]
+
     def _getPropertyReturnData(self):
         """!
         @brief Get the property function return data and property name
@@ -811,13 +1014,8 @@ class StringClassDescription(JsonHelper):
             maxIndex += 1
         print (optionText)
 
-        propertyId = None
-        while propertyId is None:
-            propertyIndex = int(input("Enter property [0 - "+str(maxIndex-1)+"]: "))
-            if (propertyIndex >= 0) and (propertyIndex < maxIndex):
-                propertyId = propertyOptions[propertyIndex]
-            else:
-                print ("Valid input values are 0 to "+str(maxIndex-1)+", try again")
+        propertyIndex = self._inputInt("Enter property [0 - "+str(maxIndex-1)+"]: ", 0, maxIndex-1)
+        propertyId = propertyOptions[propertyIndex]
 
         returnType, returnDesc, isList = LanguageDescriptionList.getLanguagePropertyReturnData(propertyId)
         methodName = LanguageDescriptionList.getLanguagePropertyMethodName(propertyId)
@@ -842,14 +1040,13 @@ class StringClassDescription(JsonHelper):
             # Print entry for user to inspect
             print(methodName+":")
             print(newEntry)
-            commit = input("Is this correct? [Y/N]").upper()
-            if ((commit == 'Y') or (commit == "YES")):
-                entryCorrect = True
+            entryCorrect = self._inputConfirm("Is this correct? [Y/N]")
 
         # Check for existing for match
-        commitFlag = self._getCommitFlag(methodName, self.stringJasonData['propertyMethods'].keys(), override)
+        commitFlag = self._commitEntry(self.stringJasonData['propertyMethods'], methodName, newEntry, override)
         if commitFlag:
-            self.stringJasonData['propertyMethods'][methodName] = newEntry
+            self.propertyNameIndex = None
+            self.stringDataDirty = True
 
         return commitFlag
 
@@ -871,19 +1068,16 @@ class StringClassDescription(JsonHelper):
 
             newEntry = self._definePropertyFunctionEntry(propertyName, methodDesc, returnType, returnDesc)
 
-            commitFlag = self._getCommitFlag(methodName, self.stringJasonData['propertyMethods'].keys(), override)
-            if commitFlag:
-                # Add the entry
-                self.stringJasonData['propertyMethods'][methodName] = newEntry
+            if self._commitEntry(self.stringJasonData['propertyMethods'], methodName, newEntry, override):
+                self.propertyNameIndex = None
+                self.stringDataDirty = True
 
     def updateTranlations(self, jsonLangData:LanguageDescriptionList = None):
         """!
         @brief Update the translation strings in the translation methods
         @param jsonLangData {LanguageDescriptionList} Updated language list defintions
         """
-        methodList = self.getPropertyMethodList()
-        for methodName in methodList:
-            self._translateMethodText(methodName, jsonLangData)
+        self._translateMissingText(self.getTranlateMethodList(), jsonLangData)
 
 
 #################################
@@ -896,6 +1090,7 @@ def SetBaseClassName(classStrings:StringClassDescription, classname:str):
     @param classname {string} Name of the base class
     """
     classStrings.setBaseClassName(classname)
+    classStrings.update()
 
 def AddTranslateMethodEntry(classStrings:StringClassDescription, languageList:LanguageDescriptionList, forceUpdate:bool = False):
     """!
@@ -910,11 +1105,14 @@ def AddTranslateMethodEntry(classStrings:StringClassDescription, languageList:La
         print ("Updating JSON file")
         classStrings.update()
 
-def AddPropertyMethodEntry(classStrings:StringClassDescription):
+def AddPropertyMethodEntry(classStrings:StringClassDescription, forceUpdate:bool = False):
     """!
     @brief Add a property string function to the self.langJsonData data
+    @param classStrings (StringClassDescription) - Object to add property method to
+    @param forceUpdate {boolean} True force the update without user intervention,
+                                 False request update confermation on all methods
     """
-    commit = classStrings.newPropertyMethodEntry()
+    commit = classStrings.newPropertyMethodEntry(forceUpdate)
     if commit:
         print ("Updating JSON file")
         classStrings.update()
@@ -933,17 +1131,17 @@ def CommandMain():
     """
     import argparse
     import pathlib
+
+    # Subcommand handlers, called with (classStrings, languageData, args)
+    commandHandlers = {'addproperty': lambda classStrings, languageData, args: AddPropertyMethodEntry(classStrings, args.force),
+                       'addtranslate': lambda classStrings, languageData, args: AddTranslateMethodEntry(classStrings, languageData, args.force),
+                       'setclassname': lambda classStrings, languageData, args: SetBaseClassName(classStrings, args.classname),
+                       'print': lambda classStrings, languageData, args: PrintMethods(classStrings),
+                       'create': lambda classStrings, languageData, args: SetBaseClassName(classStrings, args.classname)}
+
     progStart = "jsonStringClassDescription -s <filename>"
-    subcmdList = ["addproperty", "addtranslate", "setclassname", "print", "create"]
     mainparserProg = progStart+" "
-
-    subcmdDesc = ""
-    subcmdNamePrefix = "<"
-    for subcmdName in subcmdList:
-        subcmdDesc += subcmdNamePrefix
-        subcmdDesc += subcmdName
-        subcmdNamePrefix = "|"
-    subcmdDesc += ">"
+    subcmdDesc = "<"+"|".join(commandHandlers)+">"
 
     # Create the command parser
     parser = argparse.ArgumentParser(prog=mainparserProg+" "+subcmdDesc+" [subcommand options]",
@@ -975,26 +1173,15 @@ def CommandMain():
     args = parser.parse_args()
 
     classStrings = StringClassDescription(args.jsonStrClassFile)
-    if args.jsonLangFile is not None:
-        languageData = LanguageDescriptionList(args.jsonLangFile)
+    # Only the addproperty and addtranslate subcommands take a language list file
+    jsonLangFile = getattr(args, 'jsonLangFile', None)
+    if jsonLangFile is not None:
+        languageData = LanguageDescriptionList(jsonLangFile)
     else:
         languageData = None
 
-    # Process subcommand
-    if args.subcommand.lower() == "addproperty":
-        AddPropertyMethodEntry(classStrings, args.force)
-    elif args.subcommand.lower() == "addtranslate":
-        AddTranslateMethodEntry(classStrings, languageData, args.force)
-    elif args.subcommand.lower() == "print":
-        PrintMethods(classStrings)
-    elif args.subcommand.lower() == "create":
-        classStrings.setBaseClassName(args.classname)
-        classStrings.update()
-    elif args.subcommand.lower() == "setclassname":
-        classStrings.setBaseClassName(args.classname)
-    else:
-        print ("Error: Unknown JSON string method definition file command: "+args.subcommand)
-        SystemExit(1)
+    # Process subcommand, the subparsers only accept the handler keys
+    commandHandlers[args.subcommand](classStrings, languageData, args)
 
 if __name__ == '__main__':
     CommandMain()
\ No newline at end of file
@@ -34,6 +34,14 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
     """!
     Methods for Windows language select function generation
     """
+    # Constant select function parameter and OS check, shared by all instances
+    _paramDictList = [ParamRetDict.buildParamDict("langId", "LANGID", "Return value from GetUserDefaultUILanguage() call")]
+    _defOsString = "(defined(_WIN64) || defined(_WIN32))"
+
+    # Select function body and switch case label indentation
+    _bodyIndent = "    "
+    _caseIndent = _bodyIndent+"    "
+
     def __init__(self, jsonLangData:LanguageDescriptionList, owner:str|None = None, eulaName:str|None = None, baseClassName:str = "BaseClass",
                  dynamicCompileSwitch:str = "DYNAMIC_INTERNATIONALIZATION"):
         """!
@@ -47,8 +55,8 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         super().__init__(owner, eulaName, baseClassName, dynamicCompileSwitch)
         self.selectFunctionName = "get"+baseClassName+"_Windows"
 
-        self.paramDictList = [ParamRetDict.buildParamDict("langId", "LANGID", "Return value from GetUserDefaultUILanguage() call")]
-        self.defOsString = "(defined(_WIN64) || defined(_WIN32))"
+        self.paramDictList = WindowsLangSelectFunctionGenerator._paramDictList
+        self.defOsString = WindowsLangSelectFunctionGenerator._defOsString
         self.langJsonData = jsonLangData
         self.doxyCommentGen = CDoxyCommentGenerator()
 
@@ -80,6 +88,21 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         """
         return self._endFunction(self.selectFunctionName)
 
+    def _getLangCaseData(self)->list:
+        """!
+        @brief Get the current per language LANGID data used by the function and unit test generators
+        @return list of tuples - (language name, LANGID & 0xFF codes, full LANGID codes,
+                                  ISO code, switch case label lines)
+        """
+        caseIndent = WindowsLangSelectFunctionGenerator._caseIndent
+        langCaseData = []
+        for langName in self.langJsonData.getLanguageList():
+            langCodes, regionList = self.langJsonData.getLanguageLANGIDData(langName)
+            isoCode = self.langJsonData.getLanguageIsoCodeData(langName)
+            caseLines = "".join([caseIndent+"case "+hex(langCode)+":\n" for langCode in langCodes])
+            langCaseData.append((langName, langCodes, regionList, isoCode, caseLines))
+        return langCaseData
+
     def genFunction(self, outfile):
         """!
         @brief Generate the function body text
@@ -96,23 +119,18 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         functionBody.extend(self.genFunctionDefine())
 
         # Start function body generation
-        bodyIndent = "    "
+        bodyIndent = WindowsLangSelectFunctionGenerator._bodyIndent
         functionBody.append(bodyIndent+"switch("+paramName+" & 0x0FF)\n")
         functionBody.append(bodyIndent+"{\n")
 
         # Generate case if chain for each language in the dictionary
-        caseIndent = bodyIndent+"".rjust(4, " ")
-        caseBodyIndent = caseIndent+"".rjust(4, " ")
-        for langName in self.langJsonData.getLanguageList():
-            langCodes, langRegionList = self.langJsonData.getLanguageLANGIDData(langName)
-            for id in langCodes:
-                caseline =  caseIndent+"case "
-                caseline += hex(id)
-                caseline += ":\n"
-                functionBody.append(caseline)
-            caseAssign = caseBodyIndent+self._genMakePtrReturnStatement(langName)
-            functionBody.append(caseAssign)
-            functionBody.append(caseBodyIndent+"break;\n")
+        caseIndent = WindowsLangSelectFunctionGenerator._caseIndent
+        caseBodyIndent = caseIndent+"    "
+        caseBreak = caseBodyIndent+"break;\n"
+        for langName, langCodes, regionList, isoCode, caseLines in self._getLangCaseData():
+            functionBody.append(caseLines)
+            functionBody.append(caseBodyIndent+self._genMakePtrReturnStatement(langName))
+            functionBody.append(caseBreak)
 
         # Add the final default case
         defaultLang, defaultIsoCode = self.langJsonData.getDefaultData()
@@ -123,7 +141,7 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         # Complete the function
         functionBody.append(self.genFunctionEnd())
         functionBody.append("#endif // "+self.defOsString+"\n")
-        outfile.writelines(functionBody)
+        outfile.write("".join(functionBody))
 
     def genReturnFunctionCall(self, indent:int = 4)->list:
         """!
@@ -131,21 +149,11 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         @param indent {number} Code indentation spaces
         @return list of strings Formatted code lines
         """
-        indentText = "".rjust(indent, " ")
+        indentText = " "*indent
         localVarName = "langId"
 
-        getParam = indentText
-        getParam += ParamRetDict.getParamType(self.paramDictList[0])
-        getParam += " "
-        getParam += localVarName
-        getParam += "= GetUserDefaultUILanguage();\n"
-
-        doCall = indentText
-        doCall += "return "
-        doCall += self.selectFunctionName
-        doCall += "("
-        doCall += localVarName
-        doCall += ");\n"
+        getParam = f"{indentText}{ParamRetDict.getParamType(self.paramDictList[0])} {localVarName}= GetUserDefaultUILanguage();\n"
+        doCall = f"{indentText}return {self.selectFunctionName}({localVarName});\n"
 
         return [getParam, doCall]
 
@@ -161,20 +169,18 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         @return list of strings - Output C code
         """
         testBlockName = "WindowsSelectFunction"
-        bodyIndent = "".rjust(4, " ")
-        breifDesc = "Test "+self.selectFunctionName+" "+str(langid)+" selection case"
+        bodyIndent = "    "
+        breifDesc = f"Test {self.selectFunctionName} {langid} selection case"
         testBody = self.doxyCommentGen.genDoxyMethodComment(breifDesc, [])
 
         testVar = "testVar"
-        testVarDecl = self.baseIntfRetPtrType+" "+testVar
-        testVarTest = testVar+"->"+getIsoMethod+"().c_str()"
-        testBody.append("TEST("+testBlockName+", "+testName+")\n")
+        testBody.append(f"TEST({testBlockName}, {testName})\n")
         testBody.append("{\n")
         testBody.append(bodyIndent+"// Generate the test language string object\n")
 
         testBody.append("\n") # whitespace for readability
-        testBody.append(bodyIndent+testVarDecl+" = "+self.selectFunctionName+"("+str(langid)+");\n")
-        testBody.append(bodyIndent+"EXPECT_STREQ(\""+expectedIso+"\", "+testVarTest+");\n")
+        testBody.append(f"{bodyIndent}{self.baseIntfRetPtrType} {testVar} = {self.selectFunctionName}({langid});\n")
+        testBody.append(f"{bodyIndent}EXPECT_STREQ(\"{expectedIso}\", {testVar}->{getIsoMethod}().c_str());\n")
         testBody.append("}\n")
         return testBody
 
@@ -183,16 +189,8 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         @brief Return the external function definition
         @return string - External function definition line
         """
-        externDef = "extern "
-        externDef += self.baseIntfRetPtrType
-        externDef += " "
-        externDef += self.selectFunctionName
-        externDef += "("
-        externDef += ParamRetDict.getParamType(self.paramDictList[0])
-        externDef += " "
-        externDef += ParamRetDict.getParamName(self.paramDictList[0])
-        externDef += ");\n"
-        return externDef
+        paramDict = self.paramDictList[0]
+        return f"extern {self.baseIntfRetPtrType} {self.selectFunctionName}({ParamRetDict.getParamType(paramDict)} {ParamRetDict.getParamName(paramDict)});\n"
 
     def genUnitTest(self, getIsoMethod:str, outfile):
         """!
@@ -202,57 +200,44 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         @param outfile {file} File to output the function to
         """
         # Generate block start code
-        blockStart = []
-        blockStart.append("#if "+self.defOsString+"\n")
-        blockStart.append("\n") # white space for readability
-        blockStart.append(self._genInclude("<windows.h>"))
-        blockStart.append(self.genExternDefinition())
-        blockStart.append("\n") # white space for readability
-        outfile.writelines(blockStart)
+        testFileBody = []
+        testFileBody.append("#if "+self.defOsString+"\n")
+        testFileBody.append("\n") # white space for readability
+        testFileBody.append(self._genInclude("<windows.h>"))
+        testFileBody.append(self.genExternDefinition())
+        testFileBody.append("\n") # white space for readability
 
         # Generate the tests
-        for langName in self.langJsonData.getLanguageList():
-            langCodes, regionList = self.langJsonData.getLanguageLANGIDData(langName)
+        for langName, langCodes, regionList, isoCode, caseLines in self._getLangCaseData():
+            testNamePrefix = langName.capitalize()+"_"
             for langId in regionList:
                 # Generate test for each region of known language
-                testName = langName.capitalize()+"_"+str(langId)+"_Selection"
-                testBody = self._genUnitTestTest(testName,
-                                                 langId,
-                                                 self.langJsonData.getLanguageIsoCodeData(langName),
-                                                 getIsoMethod)
-                testBody.append("\n") # whitespace for readability
-                outfile.writelines(testBody)
+                testName = testNamePrefix+str(langId)+"_Selection"
+                testFileBody.extend(self._genUnitTestTest(testName, langId, isoCode, getIsoMethod))
+                testFileBody.append("\n") # whitespace for readability
 
             # Generate test for unknown region of known language(s)
             for langCode in langCodes:
-                unknownRegionTestName = langName.capitalize()+"_unknownRegion_00"+str(langCode)+"_Selection"
-                unknownRegionBody = self._genUnitTestTest(unknownRegionTestName,
-                                                          langCode,
-                                                          self.langJsonData.getLanguageIsoCodeData(langName),
-                                                          getIsoMethod)
-                unknownRegionBody.append("\n") # whitespace for readability
-                outfile.writelines(unknownRegionBody)
+                unknownRegionTestName = testNamePrefix+"unknownRegion_00"+str(langCode)+"_Selection"
+                testFileBody.extend(self._genUnitTestTest(unknownRegionTestName, langCode, isoCode, getIsoMethod))
+                testFileBody.append("\n") # whitespace for readability
 
             # Generate test for unknown region of known language(s)
             for langCode in langCodes:
-                unknownRegionTestName = langName.capitalize()+"_unknownRegion_FF"+str(langCode)+"_Selection"
-                unknownRegionBody = self._genUnitTestTest(unknownRegionTestName,
-                                                          0xFF00+langCode,
-                                                          self.langJsonData.getLanguageIsoCodeData(langName),
-                                                          getIsoMethod)
-                unknownRegionBody.append("\n") # whitespace for readability
-                outfile.writelines(unknownRegionBody)
+                unknownRegionTestName = testNamePrefix+"unknownRegion_FF"+str(langCode)+"_Selection"
+                testFileBody.extend(self._genUnitTestTest(unknownRegionTestName, 0xFF00+langCode, isoCode, getIsoMethod))
+                testFileBody.append("\n") # whitespace for readability
 
         # Generate test for unknown region of unknown language and expect default
         defaultLang, defaultIsoCode = self.langJsonData.getDefaultData()
-        unknownLangBody = self._genUnitTestTest("UnknownLanguageDefaultSelection",
-                                                0,
-                                                defaultIsoCode,
-                                                getIsoMethod)
-        outfile.writelines(unknownLangBody)
+        testFileBody.extend(self._genUnitTestTest("UnknownLanguageDefaultSelection",
+                                                  0,
+                                                  defaultIsoCode,
+                                                  getIsoMethod))
 
         # Generate block end code
-        outfile.writelines(["#endif // "+self.defOsString+"\n"])
+        testFileBody.append("#endif // "+self.defOsString+"\n")
+        outfile.write("".join(testFileBody))
 
     def genUnitTestFunctionCall(self, checkVarName:str, indent:int = 4)->list:
         """!
@@ -261,24 +246,11 @@ class WindowsLangSelectFunctionGenerator(BaseStringClassGenerator):
         @param indent {number} Code indentation spaces
         @return list of strings Formatted code lines
         """
-        indentText = "".rjust(indent, " ")
+        indentText = " "*indent
         localVarName = "langId"
 
-        getParam = indentText
-        getParam += ParamRetDict.getParamType(self.paramDictList[0])
-        getParam += " "
-        getParam += localVarName
-        getParam += " = GetUserDefaultUILanguage();\n"
-
-        doCall = indentText
-        doCall += self.baseIntfRetPtrType
-        doCall += " "
-        doCall += checkVarName
-        doCall += " = "
-        doCall += self.selectFunctionName
-        doCall += "("
-        doCall += localVarName
-        doCall += ");\n"
+        getParam = f"{indentText}{ParamRetDict.getParamType(self.paramDictList[0])} {localVarName} = GetUserDefaultUILanguage();\n"
+        doCall = f"{indentText}{self.baseIntfRetPtrType} {checkVarName} = {self.selectFunctionName}({localVarName});\n"
 
         return [getParam, doCall]
 
@@ -33,6 +33,17 @@ from file_tools.json_data.param_return_tools import ParamRetDict
 # Create default langauge list JSON file
 ######################################
 ######################################
+# Default language region and LANGID data
+_englishLinuxRegions = ("AU","BZ","CA","CB","GB","IE","JM","NZ","PH","TT","US","ZA","ZW")
+_englishWinLanIDs = (3081,10249,4105,9225,2057,16393,6153,8201,5129,13321,7177,11273,1033,12297)
+_spanishLinuxRegions = ("AR","BO","CL","CO","CR","DO","EC","ES","GT","HN",
+                        "MX","NI","PA","PE","PR","PY","SV","UY","VE")
+_spanishWinLanIDs = (11274,16394,13322,9226,5130,7178,12298,17418,4106,18442,2058,19466,6154,15370,10250,20490,1034,14346,8202)
+_frenchLinuxRegions = ("BE","CA","CH","FR","LU","MC")
+_frenchWinLanIDs = (2060,11276,3084,9228,12300,1036,5132,13324,6156,14348,10252,4108,7180)
+_chineseLinuxRegions = ("CN","HK","MO","SG","TW")
+_chineseWinLanIDs = (2052,3076,5124,4100,1028)
+
 def AddEnglish(languages:LanguageDescriptionList):
     """!
     @brief Add the english language definition
@@ -40,11 +51,7 @@ def AddEnglish(languages:LanguageDescriptionList):
 
     @param languages (LanguageDescriptionList) - Object to add to
     """
-    linuxEnv = "en"
-    linuxRegionList = ["AU","BZ","CA","CB","GB","IE","JM","NZ","PH","TT","US","ZA","ZW"]
-    winLanID = [0x09]
-    winLanIDList = [3081,10249,4105,9225,2057,16393,6153,8201,5129,13321,7177,11273,1033,12297]
-    languages.addLanguage("english", linuxEnv, linuxRegionList, winLanID, winLanIDList, "en", "ENGLISH_ERRORS")
+    languages.addLanguage("english", "en", list(_englishLinuxRegions), [0x09], list(_englishWinLanIDs), "en", "ENGLISH_ERRORS")
 
 def AddSpanish(languages:LanguageDescriptionList):
     """!
@@ -53,12 +60,7 @@ def AddSpanish(languages:LanguageDescriptionList):
 
     @param languages (LanguageDescriptionList) - Object to add to
     """
-    linuxEnv = "es"
-    linuxRegionList = ["AR","BO","CL","CO","CR","DO","EC","ES","GT","HN",
-                       "MX","NI","PA","PE","PR","PY","SV","UY","VE"]
-    winLanID = [0x0A]
-    winLanIDList = [11274,16394,13322,9226,5130,7178,12298,17418,4106,18442,2058,19466,6154,15370,10250,20490,1034,14346,8202]
-    languages.addLanguage("spanish", linuxEnv, linuxRegionList, winLanID, winLanIDList, "es", "SPANISH_ERRORS")
+    languages.addLanguage("spanish", "es", list(_spanishLinuxRegions), [0x0A], list(_spanishWinLanIDs), "es", "SPANISH_ERRORS")
 
 def AddFrench(languages:LanguageDescriptionList):
     """!
@@ -67,11 +69,7 @@ def AddFrench(languages:LanguageDescriptionList):
 
     @param languages (LanguageDescriptionList) - Object to add to
     """
-    linuxEnv = "fr"
-    linuxRegionList = ["BE","CA","CH","FR","LU","MC"]
-    winLanID = [0x0C]
-    winLanIDList = [2060,11276,3084,9228,12300,1036,5132,13324,6156,14348,10252,4108,7180]
-    languages.addLanguage("french", linuxEnv, linuxRegionList, winLanID, winLanIDList, "fr", "FRENCH_ERRORS")
+    languages.addLanguage("french", "fr", list(_frenchLinuxRegions), [0x0C], list(_frenchWinLanIDs), "fr", "FRENCH_ERRORS")
 
 def AddSimplifiedChinese(languages:LanguageDescriptionList):
     """!
@@ -80,11 +78,7 @@ def AddSimplifiedChinese(languages:LanguageDescriptionList):
 
     @param languages (LanguageDescriptionList) - Object to add to
     """
-    linuxEnv = "zh"
-    linuxRegionList = ["CN","HK","MO","SG","TW"]
-    winLanID = [0x04]
-    winLanIDList = [2052,3076,5124,4100,1028]
-    languages.addLanguage("SimplifiedChinese", linuxEnv, linuxRegionList, winLanID, winLanIDList, "zh", "CHINESE_ERRORS")
+    languages.addLanguage("SimplifiedChinese", "zh", list(_chineseLinuxRegions), [0x04], list(_chineseWinLanIDs), "zh", "CHINESE_ERRORS")
 
 def CreateDefaultLanguageListFile(languages:LanguageDescriptionList):
     """!
@@ -103,6 +97,119 @@ def CreateDefaultLanguageListFile(languages:LanguageDescriptionList):
 # Create default strings json file
 ######################################
 ######################################
+
+# Parameters shared by several default translate methods.  The translate method
+# data only reads these, so every entry can use the same dictionary.
+_keyStringParam = ParamRetDict.buildParamDictWithMod("keyString", "string", "Error key")
+_nargsExpectedParam = ParamRetDict.buildParamDictWithMod("nargsExpected", "size", "Expected assignment list length")
+_nargsFoundParam = ParamRetDict.buildParamDictWithMod("nargsFound", "size", "Input assignment list length")
+_envKeyStringParam = ParamRetDict.buildParamDictWithMod("envKeyString", "string", "Flag key")
+
+# Default translate method entries (method name, brief description, parameter tuple,
+# return dictionary, translate string), all written in _defaultTranslateIsoCode
+_defaultTranslateIsoCode = "en"
+_defaultTranslateEntries = (
+    # General argument parsing messages
+    ("getNotListTypeMessage", "Return non-list varg error message",
+     (ParamRetDict.buildParamDictWithMod("nargs", "integer", "input nargs value"),),
+     ParamRetDict.buildReturnDict("string", "Non-list varg error message"),
+     "Only list type arguments can have an argument count of @nargs@"),
+
+    ("getUnknownArgumentMessage", "Return unknown parser key error message",
+     (ParamRetDict.buildParamDictWithMod("keyString", "string", "Unknown key"),),
+     ParamRetDict.buildReturnDict("string", "Unknown parser key error message"),
+     "Unknown argument: @keyString@"),
+
+    ("getInvalidAssignmentMessage", "Return varg invalid assignment error message",
+     (_keyStringParam,),
+     ParamRetDict.buildReturnDict("string", "Varg key invalid assignment error message"),
+     "\"@keyString@\" invalid assignment"),
+
+    ("getAssignmentFailedMessage", "Return varg assignment failed error message",
+     (_keyStringParam,
+      ParamRetDict.buildParamDictWithMod("valueString", "string", "Assignment value")),
+     ParamRetDict.buildReturnDict("string", "Varg key assignment failed error message"),
+     "\"@keyString@\", \"@valueString@\" assignment failed"),
+
+    ("getMissingAssignmentMessage", "Return varg missing assignment error message",
+     (_keyStringParam,),
+     ParamRetDict.buildReturnDict("string", "Varg key missing value assignment error message"),
+     "\"@keyString@\" missing assignment value"),
+
+    ("getMissingListAssignmentMessage", "Return varg missing list value assignment error message",
+     (_keyStringParam,
+      _nargsExpectedParam,
+      _nargsFoundParam),
+     ParamRetDict.buildReturnDict("string", "Varg key input value list too short error message"),
+     "\"@keyString@\" missing assignment value(s). Expected: @nargsExpected@ found: @nargsFound@ arguments"),
+
+    ("getTooManyAssignmentMessage", "Return varg missing list value assignment error message",
+     (_keyStringParam,
+      _nargsExpectedParam,
+      _nargsFoundParam),
+     ParamRetDict.buildReturnDict("string", "Varg key input value list too long error message"),
+     "\"@keyString@\" too many assignment values. Expected: @nargsExpected@ found: @nargsFound@ arguments"),
+
+    ("getMissingArgumentMessage", "Return required varg missing error message",
+     (_keyStringParam,),
+     ParamRetDict.buildReturnDict("string", "Required varg key missing error message"),
+     "\"@keyString@\" required argument missing"),
+
+    ("getArgumentCreationError", "Return parser add varg failure error message",
+     (_keyStringParam,),
+     ParamRetDict.buildReturnDict("string", "Parser varg add failure message"),
+     "Argument add failed: @keyString@"),
+
+    # Command Line parser messages
+    ("getUsageMessage", "Return usage help message",
+     (),
+     ParamRetDict.buildReturnDict("string", "Usage help message"),
+     "Usage:"),
+
+    ("getPositionalArgumentsMessage", "Return positional argument help message",
+     (),
+     ParamRetDict.buildReturnDict("string", "Positional argument help message"),
+     "Positional Arguments:"),
+
+    ("getSwitchArgumentsMessage", "Return optional argument help message",
+     (),
+     ParamRetDict.buildReturnDict("string", "Optional argument help message"),
+     "Optional Arguments:"),
+
+    ("getHelpString", "Return default help switch help message",
+     (),
+     ParamRetDict.buildReturnDict("string", "Default help argument help message"),
+     "show this help message and exit"),
+
+    # Environment parser messages
+    ("getEnvArgumentsMessage", "Return environment parser argument help header",
+     (),
+     ParamRetDict.buildReturnDict("string", "Environment parser argument help header message"),
+     "Defined Environment values:"),
+
+    ("getEnvironmentNoFlags", "Return environment parser add flag varg failure error message",
+     (_envKeyStringParam,),
+     ParamRetDict.buildReturnDict("string", "Environment parser add flag varg failure message"),
+     "Environment value @envKeyString@ narg must be > 0"),
+
+    ("getRequiredEnvironmentArgMissing", "Return environment parser required varg missing error message",
+     (_envKeyStringParam,),
+     ParamRetDict.buildReturnDict("string", "Environment parser required varg missing error message"),
+     "Environment value @envKeyString@ must be defined"),
+
+    # JSON file parser messages
+    ("getJsonArgumentsMessage", "Return json parser argument help header",
+     (),
+     ParamRetDict.buildReturnDict("string", "JSON parser argument help header message"),
+     "Available JSON argument values:"),
+
+    # XML file parser messages
+    ("getXmlArgumentsMessage", "Return xml parser argument help header",
+     (),
+     ParamRetDict.buildReturnDict("string", "XML parser argument help header message"),
+     "Available XML argument values:"),
+)
+
 def CreateDefaultStringFile(languageList:LanguageDescriptionList, classStrings:StringClassDescription, forceUpdate:bool = False):
     """!
     @brief Add a function to the self.langJsonData data
@@ -116,160 +223,8 @@ def CreateDefaultStringFile(languageList:LanguageDescriptionList, classStrings:S
     classStrings.setDynamicCompileSwitch("DYNAMIC_INTERNATIONALIZATION")
     classStrings.addPropertyMethodEntry("isoCode", override = forceUpdate)
 
-    # General argument parsing messages
-    classStrings.addTranslateMethodEntry("getNotListTypeMessage", "Return non-list varg error message",
-                                         [ParamRetDict.buildParamDictWithMod("nargs", "integer", "input nargs value")],
-                                         ParamRetDict.buildReturnDict("string", "Non-list varg error message"),
-                                         "en",
-                                         "Only list type arguments can have an argument count of @nargs@",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getUnknownArgumentMessage", "Return unknown parser key error message",
-                                         [ParamRetDict.buildParamDictWithMod("keyString", "string", "Unknown key")],
-                                         ParamRetDict.buildReturnDict("string", "Unknown parser key error message"),
-                                         "en",
-                                         "Unknown argument: @keyString@",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getInvalidAssignmentMessage", "Return varg invalid assignment error message",
-                                         [ParamRetDict.buildParamDictWithMod("keyString", "string", "Error key")],
-                                         ParamRetDict.buildReturnDict("string", "Varg key invalid assignment error message"),
-                                         "en",
-                                         "\"@keyString@\" invalid assignment",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getAssignmentFailedMessage", "Return varg assignment failed error message",
-                                         [ParamRetDict.buildParamDictWithMod("keyString", "string", "Error key"),
-                                          ParamRetDict.buildParamDictWithMod("valueString", "string", "Assignment value")],
-                                         ParamRetDict.buildReturnDict("string", "Varg key assignment failed error message"),
-                                         "en",
-                                         "\"@keyString@\", \"@valueString@\" assignment failed",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getMissingAssignmentMessage", "Return varg missing assignment error message",
-                                         [ParamRetDict.buildParamDictWithMod("keyString", "string", "Error key")],
-                                         ParamRetDict.buildReturnDict("string", "Varg key missing value assignment error message"),
-                                         "en",
-                                         "\"@keyString@\" missing assignment value",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getMissingListAssignmentMessage", "Return varg missing list value assignment error message",
-                                         [ParamRetDict.buildParamDictWithMod("keyString", "string", "Error key"),
-                                          ParamRetDict.buildParamDictWithMod("nargsExpected", "size", "Expected assignment list length"),
-                                          ParamRetDict.buildParamDictWithMod("nargsFound", "size", "Input assignment list length")],
-                                         ParamRetDict.buildReturnDict("string", "Varg key input value list too short error message"),
-                                         "en",
-                                         "\"@keyString@\" missing assignment value(s). Expected: @nargsExpected@ found: @nargsFound@ arguments",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getTooManyAssignmentMessage", "Return varg missing list value assignment error message",
-                                         [ParamRetDict.buildParamDictWithMod("keyString", "string", "Error key"),
-                                          ParamRetDict.buildParamDictWithMod("nargsExpected", "size", "Expected assignment list length"),
-                                          ParamRetDict.buildParamDictWithMod("nargsFound", "size", "Input assignment list length")],
-                                          ParamRetDict.buildReturnDict("string", "Varg key input value list too long error message"),
-                                         "en",
-                                         "\"@keyString@\" too many assignment values. Expected: @nargsExpected@ found: @nargsFound@ arguments",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getMissingArgumentMessage", "Return required varg missing error message",
-                                         [ParamRetDict.buildParamDictWithMod("keyString", "string", "Error key")],
-                                         ParamRetDict.buildReturnDict("string", "Required varg key missing error message"),
-                                         "en",
-                                         "\"@keyString@\" required argument missing",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getArgumentCreationError", "Return parser add varg failure error message",
-                                         [ParamRetDict.buildParamDictWithMod("keyString", "string", "Error key")],
-                                         ParamRetDict.buildReturnDict("string", "Parser varg add failure message"),
-                                         "en",
-                                         "Argument add failed: @keyString@",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    # Command Line parser messages
-    classStrings.addTranslateMethodEntry("getUsageMessage", "Return usage help message",
-                                         [],
-                                         ParamRetDict.buildReturnDict("string", "Usage help message"),
-                                         "en",
-                                         "Usage:",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getPositionalArgumentsMessage", "Return positional argument help message",
-                                         [],
-                                         ParamRetDict.buildReturnDict("string", "Positional argument help message"),
-                                         "en",
-                                         "Positional Arguments:",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-
-    classStrings.addTranslateMethodEntry("getSwitchArgumentsMessage", "Return optional argument help message",
-                                         [],
-                                         ParamRetDict.buildReturnDict("string", "Optional argument help message"),
-                                         "en",
-                                         "Optional Arguments:",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getHelpString", "Return default help switch help message",
-                                         [],
-                                         ParamRetDict.buildReturnDict("string", "Default help argument help message"),
-                                         "en",
-                                         "show this help message and exit",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    # Environment parser messages
-    classStrings.addTranslateMethodEntry("getEnvArgumentsMessage", "Return environment parser argument help header",
-                                         [],
-                                         ParamRetDict.buildReturnDict("string", "Environment parser argument help header message"),
-                                         "en",
-                                         "Defined Environment values:",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getEnvironmentNoFlags", "Return environment parser add flag varg failure error message",
-                                         [ParamRetDict.buildParamDictWithMod("envKeyString", "string", "Flag key")],
-                                         ParamRetDict.buildReturnDict("string", "Environment parser add flag varg failure message"),
-                                         "en",
-                                         "Environment value @envKeyString@ narg must be > 0",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    classStrings.addTranslateMethodEntry("getRequiredEnvironmentArgMissing", "Return environment parser required varg missing error message",
-                                         [ParamRetDict.buildParamDictWithMod("envKeyString", "string", "Flag key")],
-                                         ParamRetDict.buildReturnDict("string", "Environment parser required varg missing error message"),
-                                         "en",
-                                         "Environment value @envKeyString@ must be defined",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-
-    # JSON file parser messages
-    classStrings.addTranslateMethodEntry("getJsonArgumentsMessage", "Return json parser argument help header",
-                                         [],
-                                         ParamRetDict.buildReturnDict("string", "JSON parser argument help header message"),
-                                         "en",
-                                         "Available JSON argument values:",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
-    # XML file parser messages
-    classStrings.addTranslateMethodEntry("getXmlArgumentsMessage", "Return xml parser argument help header",
-                                         [],
-                                         ParamRetDict.buildReturnDict("string", "XML parser argument help header message"),
-                                         "en",
-                                         "Available XML argument values:",
-                                         override = forceUpdate,
-                                         languageList = languageList)
-
+    # Add the default translate methods, translated with one request per language
+    entryList = [(methodName, methodDesc, paramList, returnDict, _defaultTranslateIsoCode, translateString)
+                 for methodName, methodDesc, paramList, returnDict, translateString in _defaultTranslateEntries]
+    classStrings.addTranslateMethodEntries(entryList, override = forceUpdate, languageList = languageList)
     classStrings.update()
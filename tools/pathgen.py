@@ -26,6 +26,7 @@ for the argparse libraries
 #==========================================================================
 
 import os
+import functools
 
 class FileNameGenerator(object):
     jsonFileDir = "../data"
@@ -37,6 +38,17 @@ class FileNameGenerator(object):
     def __init__(self):
         pass
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _buildJsonFileName(directory, baseName:str)->str:
+        """!
+        @brief Build the JSON file name, cached since the same names are requested repeatedly
+        @param directory {path} - Path to the file location
+        @param baseName {string} - JSON file base name
+        @return string File name and path of the JSON file
+        """
+        return os.path.join(directory, baseName)
+
     @staticmethod
     def getLanguageDescriptionBaseFileName()->str:
         """!
@@ -52,11 +64,10 @@ class FileNameGenerator(object):
         @param directory {path} - Path to the file location
         @return string Default file name and path of the language description JSON file
         """
-        if directory is None:
-            return os.path.join(FileNameGenerator.jsonFileDir, FileNameGenerator.getLanguageDescriptionBaseFileName())
-        else:
+        if directory is not None:
             FileNameGenerator.jsonFileDir = directory
-            return os.path.join(directory, FileNameGenerator.getLanguageDescriptionBaseFileName())
+        return FileNameGenerator._buildJsonFileName(FileNameGenerator.jsonFileDir,
+                                                    FileNameGenerator.getLanguageDescriptionBaseFileName())
 
     @staticmethod
     def getStringClassDescriptionBaseFileName()->str:
@@ -68,11 +79,10 @@ class FileNameGenerator(object):
 
     @staticmethod
     def getStringClassDescriptionFileName(directory:str|None = None)->str:
-        if directory is None:
-            return os.path.join(FileNameGenerator.jsonFileDir, FileNameGenerator.getStringClassDescriptionBaseFileName())
-        else:
+        if directory is not None:
             FileNameGenerator.jsonFileDir = directory
-            return os.path.join(directory, FileNameGenerator.getStringClassDescriptionBaseFileName())
+        return FileNameGenerator._buildJsonFileName(FileNameGenerator.jsonFileDir,
+                                                    FileNameGenerator.getStringClassDescriptionBaseFileName())
 
     @staticmethod
     def buildOutputFileName(baseName:str, ext:str, subdir:str|None = None)->str:
@@ -0,0 +1,7 @@
+"""@package argparselangautogen
+pytest configuration, makes the tools directory modules importable
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,67 @@
+"""@package argparselangautogen
+JsonHelper file read/write tests
+"""
+import pytest
+
+from file_tools.json_data import jsonHelper
+from file_tools.json_data.jsonHelper import JsonHelper
+
+_nonAsciiData = {'translateDesc': {'de': [[0, "Ungültige Zuweisung"]], 'zh': [[0, "无效赋值"]]}}
+
+@pytest.fixture(params=["orjson", "json"])
+def jsonBackend(request, monkeypatch):
+    """!
+    Run the test with orjson (when installed) and with the standard library fallback
+    """
+    if request.param == "orjson":
+        if jsonHelper.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(jsonHelper, "orjson", None)
+    return request.param
+
+@pytest.mark.parametrize("prettyPrint", [True, False])
+def test_NonAsciiRoundTrip(tmp_path, jsonBackend, prettyPrint):
+    fileName = tmp_path/"data.json"
+    JsonHelper.writeJsonFile(fileName, _nonAsciiData, prettyPrint)
+
+    # Non-ASCII text is written as UTF-8, not \u escapes
+    rawData = fileName.read_bytes()
+    assert "Ungültige".encode('utf-8') in rawData
+    assert b"\\u" not in rawData
+    assert JsonHelper.readJsonFile(fileName) == _nonAsciiData
+
+@pytest.mark.parametrize("prettyPrint", [True, False])
+def test_BackendsWriteSameBytes(tmp_path, monkeypatch, prettyPrint):
+    if jsonHelper.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    orjsonFileName = tmp_path/"orjson.json"
+    JsonHelper.writeJsonFile(orjsonFileName, _nonAsciiData, prettyPrint)
+
+    monkeypatch.setattr(jsonHelper, "orjson", None)
+    jsonFileName = tmp_path/"json.json"
+    JsonHelper.writeJsonFile(jsonFileName, _nonAsciiData, prettyPrint)
+
+    assert orjsonFileName.read_bytes() == jsonFileName.read_bytes()
+
+def test_FailedWriteRemovesTempFile(tmp_path, jsonBackend, monkeypatch):
+    fileName = tmp_path/"data.json"
+    JsonHelper.writeJsonFile(fileName, _nonAsciiData)
+
+    def failingReplace(sourceName, destinationName):
+        raise OSError("replace failed")
+    monkeypatch.setattr(jsonHelper.os, "replace", failingReplace)
+
+    with pytest.raises(OSError):
+        JsonHelper.writeJsonFile(fileName, {'changed': True})
+
+    # The original file is untouched and no temporary file is left behind
+    assert JsonHelper.readJsonFile(fileName) == _nonAsciiData
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["data.json"]
+
+def test_UnserializableDataLeavesNoTempFile(tmp_path, jsonBackend):
+    fileName = tmp_path/"data.json"
+    with pytest.raises(TypeError):
+        JsonHelper.writeJsonFile(fileName, {'bad': object()})
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,21 @@
+"""@package argparselangautogen
+LanguageDescriptionList command line tests
+"""
+import sys
+
+from file_tools.json_data import jsonLanguageDescriptionList
+from file_tools.json_data.jsonLanguageDescriptionList import LanguageDescriptionList
+
+def test_CreateNewRewritesExistingFile(tmp_path, monkeypatch):
+    fileName = tmp_path/"lang.json"
+    languages = LanguageDescriptionList(fileName)
+    languages.addLanguage("english", "en", ["US"], [0x09], [1033], "en", "ENGLISH_ERRORS")
+    languages.update(prettyPrint = False)
+    compactData = fileName.read_bytes()
+
+    # createnew on an existing, unchanged file still writes it
+    monkeypatch.setattr(sys, "argv", ["jsonLanguageDescriptionList", "-l", str(fileName), "createnew"])
+    jsonLanguageDescriptionList.CommandMain()
+
+    assert fileName.read_bytes() != compactData
+    assert LanguageDescriptionList(fileName).langJsonData == languages.langJsonData
@@ -0,0 +1,20 @@
+"""@package argparselangautogen
+StringClassDescription method entry tests
+"""
+from file_tools.json_data.jsonStringClassDescription import StringClassDescription
+
+def test_TranslateFunctionEntriesDoNotShareContainers(tmp_path):
+    classStrings = StringClassDescription(tmp_path/"strings.json")
+
+    firstEntry = classStrings._defineTranslateFunctionEntry("First")
+    secondEntry = classStrings._defineTranslateFunctionEntry("Second")
+    firstEntry['params'].append({'name': "value"})
+    firstEntry['return']['type'] = "string"
+    assert secondEntry['params'] == []
+    assert secondEntry['return'] == {}
+
+    # The entry gets its own copy of the caller's return dictionary
+    returnDict = {'type': "string"}
+    entry = classStrings._defineTranslateFunctionEntry("Third", [], returnDict)
+    entry['return']['desc'] = "Changed"
+    assert returnDict == {'type': "string"}
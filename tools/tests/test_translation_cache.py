@@ -0,0 +1,62 @@
+"""@package argparselangautogen
+StringClassDescription translation cache tests
+"""
+import threading
+import time
+
+from file_tools.json_data.jsonLanguageDescriptionList import LanguageDescriptionList
+from file_tools.json_data.jsonStringClassDescription import StringClassDescription
+
+class MockTranslateClient(object):
+    """!
+    Google translate client stand in, returns the text tagged with the target language
+    """
+    def __init__(self):
+        self.callCount = 0
+        self.countLock = threading.Lock()
+
+    def translate(self, textList, target_language, format_, source_language, model):
+        with self.countLock:
+            self.callCount += 1
+        time.sleep(0.01)    # Let the worker threads overlap
+        return [{'translatedText': target_language+":"+text} for text in textList]
+
+def _buildLanguageList(fileName, isoCodeList)->LanguageDescriptionList:
+    languages = LanguageDescriptionList(fileName)
+    for isoCode in isoCodeList:
+        languages.addLanguage("lang"+isoCode, isoCode, ["US"], [0x09], [1033], isoCode, "LANG_"+isoCode.upper())
+    return languages
+
+def test_MultiGroupTranslationCacheKeepsAllEntries(tmp_path, monkeypatch):
+    # Slow the cache file read down so concurrent first use would overlap
+    baseReadJsonFile = StringClassDescription.readJsonFile
+    def slowReadJsonFile(fileName):
+        time.sleep(0.01)
+        return baseReadJsonFile(fileName)
+    monkeypatch.setattr(StringClassDescription, "readJsonFile", staticmethod(slowReadJsonFile))
+
+    isoCodeList = ["en", "es", "fr", "de", "it", "zh"]
+    languages = _buildLanguageList(tmp_path/"lang.json", isoCodeList)
+
+    classStrings = StringClassDescription(tmp_path/"strings.json")
+    transClient = MockTranslateClient()
+    classStrings.transClient = transClient
+
+    methodCount = 11
+    entryList = [("getMessage"+str(index), "Message "+str(index), (), {}, "en", "Message text "+str(index))
+                 for index in range(methodCount)]
+    classStrings.addTranslateMethodEntries(entryList, override = True, languageList = languages)
+
+    # One cache entry for each method in each target language
+    assert len(classStrings.translationCache) == methodCount*(len(isoCodeList)-1)
+    assert transClient.callCount == len(isoCodeList)-1
+
+    # The saved cache satisfies the next run without any translate requests
+    classStrings.update()
+    nextRunStrings = StringClassDescription(tmp_path/"strings.json")
+    nextRunClient = MockTranslateClient()
+    nextRunStrings.transClient = nextRunClient
+    nextRunStrings.stringJasonData['translateMethods'].clear()
+    nextRunStrings.addTranslateMethodEntries(entryList, override = True, languageList = languages)
+    assert nextRunClient.callCount == 0
+    assert len(nextRunStrings.translationCache) == methodCount*(len(isoCodeList)-1)
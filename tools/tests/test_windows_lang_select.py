@@ -0,0 +1,54 @@
+"""@package argparselangautogen
+WindowsLangSelectFunctionGenerator tests
+"""
+import io
+
+from file_tools.json_data.jsonLanguageDescriptionList import LanguageDescriptionList
+from file_tools.windows_lang_select import WindowsLangSelectFunctionGenerator
+
+def _genFunctionText(generator:WindowsLangSelectFunctionGenerator)->str:
+    outfile = io.StringIO()
+    generator.genFunction(outfile)
+    return outfile.getvalue()
+
+def _genUnitTestText(generator:WindowsLangSelectFunctionGenerator)->str:
+    outfile = io.StringIO()
+    generator.genUnitTest("getIsoCode", outfile)
+    return outfile.getvalue()
+
+def test_CaseDataFollowsLanguageListChanges(tmp_path):
+    languages = LanguageDescriptionList(tmp_path/"lang.json")
+    languages.addLanguage("english", "en", ["US"], [0x09], [1033], "en", "ENGLISH_ERRORS")
+    languages.setDefault("english")
+    generator = WindowsLangSelectFunctionGenerator(languages)
+
+    functionText = _genFunctionText(generator)
+    assert "        case 0x9:\n" in functionText
+    assert "case 0xa:" not in functionText
+
+    # A reused generator picks up the new language
+    languages.addLanguage("spanish", "es", ["ES"], [0x0A], [3082], "es", "SPANISH_ERRORS")
+    functionText = _genFunctionText(generator)
+    assert "        case 0x9:\n" in functionText
+    assert "        case 0xa:\n" in functionText
+
+def test_CaseDataFollowsReplacedLanguage(tmp_path):
+    languages = LanguageDescriptionList(tmp_path/"lang.json")
+    languages.addLanguage("english", "en", ["US"], [0x09], [1033], "en", "ENGLISH_ERRORS")
+    languages.setDefault("english")
+    generator = WindowsLangSelectFunctionGenerator(languages)
+
+    assert "        case 0x9:\n" in _genFunctionText(generator)
+    assert "EXPECT_STREQ(\"en\", testVar->getIsoCode().c_str());" in _genUnitTestText(generator)
+
+    # Replace the language under the same name with new LANGID and ISO code data
+    languages.addLanguage("english", "en", ["US"], [0x10], [1040], "xx", "ENGLISH_ERRORS")
+    languages.setDefault("english")
+    functionText = _genFunctionText(generator)
+    assert "case 0x9:" not in functionText
+    assert "        case 0x10:\n" in functionText
+
+    unitTestText = _genUnitTestText(generator)
+    assert "EXPECT_STREQ(\"xx\", testVar->getIsoCode().c_str());" in unitTestText
+    assert "EXPECT_STREQ(\"en\"," not in unitTestText
+    assert "getBaseClass_Windows(1040);" in unitTestText